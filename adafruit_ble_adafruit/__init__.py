@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit`
+================================================================================
+
+Registry of the Adafruit BLE services. Each service's module is imported only when
+the service is first asked for, so a program pays the import time and RAM only for
+the services it uses. For example::
+
+    import adafruit_ble_adafruit
+
+    temp_svc = adafruit_ble_adafruit.TemperatureService()
+    accel_class = adafruit_ble_adafruit.load_service(0x200)
+
+Importing a service module directly, as in
+``from adafruit_ble_adafruit.temperature_service import TemperatureService``, still works.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+try:
+    from typing import Optional, Tuple, Union
+
+    import _bleio
+    from adafruit_ble.uuid import UUID
+except ImportError:
+    pass
+
+# (class name, module name, 16-bit service number) for each service.
+_SERVICES = (
+    ("TemperatureService", "temperature_service", 0x100),
+    ("AccelerometerService", "accelerometer_service", 0x200),
+    ("LightSensorService", "light_sensor_service", 0x300),
+    ("GyroscopeService", "gyroscope_service", 0x400),
+    ("MagnetometerService", "magnetometer_service", 0x500),
+    ("ButtonService", "button_service", 0x600),
+    ("HumidityService", "humidity_service", 0x700),
+    ("BarometricPressureService", "barometric_pressure_service", 0x800),
+    ("AddressablePixelService", "addressable_pixel_service", 0x900),
+    ("ColorSensorService", "color_sensor_service", 0xA00),
+    ("MicrophoneService", "microphone_service", 0xB00),
+    ("ToneService", "tone_service", 0xC00),
+    ("QuaternionService", "quaternion_service", 0xD00),
+    ("ProximityService", "proximity_service", 0xE00),
+    ("GestureService", "gesture_service", 0xF00),
+    ("SensorFrameService", "sensor_frame_service", 0x1000),
+)
+
+_BY_NAME = {entry[0]: entry for entry in _SERVICES}
+_BY_NUMBER = {entry[2]: entry for entry in _SERVICES}
+
+# Service classes loaded so far, by class name.
+_loaded = {}
+
+
+def service_names() -> Tuple[str, ...]:
+    """The class names of all the services, such as ``"TemperatureService"``.
+    No service modules are imported.
+    """
+    return tuple(entry[0] for entry in _SERVICES)
+
+
+def service_numbers() -> Tuple[int, ...]:
+    """The 16-bit numbers of all the services, such as ``0x100`` for `TemperatureService`,
+    as passed to `AdafruitService.adafruit_service_uuid()`. No service modules are imported.
+    """
+    return tuple(entry[2] for entry in _SERVICES)
+
+
+def _find(key: Union[str, int]) -> Tuple[str, str, int]:
+    return (_BY_NUMBER if isinstance(key, int) else _BY_NAME)[key]
+
+
+def is_loaded(key: Union[str, int]) -> bool:
+    """``True`` if the service's module has already been imported by `load_service()`."""
+    return _find(key)[0] in _loaded
+
+
+def load_service(key: Union[str, int]) -> type:
+    """Return a service class, importing its module if this is the first use.
+
+    :param key: the class name, such as ``"TemperatureService"``, or the 16-bit
+      service number, such as ``0x100``.
+    :raises KeyError: if there is no such service.
+    """
+    class_name, module_name, _ = _find(key)
+    service_class = _loaded.get(class_name)
+    if service_class is None:
+        # A non-empty fromlist makes __import__ return the submodule itself.
+        module = __import__("adafruit_ble_adafruit." + module_name, None, None, (class_name,))
+        service_class = getattr(module, class_name)
+        _loaded[class_name] = service_class
+    return service_class
+
+
+def service_for_uuid(uuid: Union[UUID, _bleio.UUID]) -> Optional[type]:
+    """Return the service class whose ``uuid`` is ``uuid``, importing its module if this
+    is the first use, or ``None`` if ``uuid`` is not an Adafruit service UUID.
+    Useful on a client for matching discovered services.
+    """
+    from adafruit_ble_adafruit.adafruit_service import AdafruitService
+
+    number = AdafruitService.adafruit_service_number(uuid)
+    if number not in _BY_NUMBER:
+        return None
+    return load_service(number)
+
+
+def __getattr__(name: str) -> type:
+    """Load service classes on first access as attributes of the package."""
+    try:
+        return load_service(name)
+    except KeyError:
+        raise AttributeError(name) from None
@@ -18,9 +18,16 @@ from adafruit_ble.attributes import Attribute
 from adafruit_ble.characteristics import Characteristic, StructCharacteristic
 
 from adafruit_ble_adafruit.adafruit_service import AdafruitService
+from adafruit_ble_adafruit.sample_burst import SampleBurst
+from adafruit_ble_adafruit.sensor_reading import SensorReadingMixin
 
+try:
+    from typing import Optional, Tuple
+except ImportError:
+    pass
 
-class AccelerometerService(AdafruitService):
+
+class AccelerometerService(SensorReadingMixin, AdafruitService):
     """Accelerometer values."""
 
     uuid = AdafruitService.adafruit_service_uuid(0x200)
@@ -34,3 +41,38 @@ class AccelerometerService(AdafruitService):
 
     measurement_period = AdafruitService.measurement_period_charac()
     """Initially 1000ms."""
+
+    _reading_name = "acceleration"
+    _reading_count = 3
+    encoding = SensorReadingMixin.encoding_charac()
+    """`CompactEncoding` used by `reading`. Initially 0: floats in ``acceleration``."""
+    encoding_scale = SensorReadingMixin.encoding_scale_charac(0.01)
+    """(scale, offset) of the compact encoding: one step is 0.01 m/s^2."""
+    compact = SensorReadingMixin.compact_charac(3)
+    """``acceleration`` in the compact `encoding`, when the client has chosen one."""
+
+    BURST_SCALE = 0.01
+    """Value of one int16 step in `burst` packets, in m/s^2."""
+
+    burst = SensorReadingMixin.burst_charac()
+    """`SampleBurst` packets of acceleration samples, once the client sets `samples_per_packet`."""
+    samples_per_packet = SensorReadingMixin.samples_per_packet_charac()
+    """Samples per `burst` packet, set by the client. Initially 0: bursts are off."""
+    burst_scale = SensorReadingMixin.burst_scale_charac(BURST_SCALE)
+    """Value of one int16 step in `burst` packets (`BURST_SCALE`)."""
+
+    def __init__(
+        self, service: Optional["AccelerometerService"] = None, *, burst_capacity: int = 64
+    ) -> None:
+        self._burst = SampleBurst(self.BURST_SCALE, burst_capacity)
+        super().__init__(service=service)
+
+    def add_burst_sample(
+        self, acceleration: Tuple[float, float, float], timestamp_us: Optional[int] = None
+    ) -> None:
+        """Buffer one acceleration sample, timestamped now if ``timestamp_us`` is not given,
+        and send a `burst` packet once `samples_per_packet` samples are buffered.
+        Call this at the sampling rate; keep setting ``acceleration`` at ``measurement_period``
+        for clients that don't use bursts.
+        """
+        self._add_burst_sample(self._burst, acceleration, timestamp_us)
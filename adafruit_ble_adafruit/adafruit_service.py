@@ -28,6 +28,7 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
 
 import struct
+import time
 
 from adafruit_ble.advertising import Advertisement, LazyObjectField
 from adafruit_ble.advertising.adafruit import (
@@ -37,14 +38,18 @@ from adafruit_ble.advertising.adafruit import (
 from adafruit_ble.advertising.standard import ManufacturerData, ManufacturerDataField
 from adafruit_ble.attributes import Attribute
 from adafruit_ble.characteristics import Characteristic
-from adafruit_ble.characteristics.int import Int32Characteristic, Uint32Characteristic
+from adafruit_ble.characteristics.int import (
+    Int32Characteristic,
+    Uint32Characteristic,
+)
 from adafruit_ble.services import Service
-from adafruit_ble.uuid import VendorUUID
+from adafruit_ble.uuid import UUID, VendorUUID
 from micropython import const
 
 try:
-    from typing import Optional
+    from typing import Any, Dict, Optional, Union
 
+    import _bleio
     from _bleio import ScanEntry
 except ImportError:
     pass
@@ -52,6 +57,13 @@ except ImportError:
 
 _PID_DATA_ID = const(0x0001)  # This is the same as the Radio data id, unfortunately.
 
+# ADAF0000-C332-42A8-93BD-25E905756CB8 as little-endian bytes, the order _bleio uses.
+# The 16-bit value goes in bytes 12 and 13.
+_ADAFRUIT_UUID_BASE = bytes.fromhex("b86c7505e925bd93a84232c30000afad")
+
+# VendorUUIDs made by AdafruitService.adafruit_service_uuid(), by 16-bit value.
+_uuid_cache = {}
+
 
 class AdafruitServerAdvertisement(Advertisement):
     """Advertise the Adafruit company ID and the board USB PID."""
@@ -89,12 +101,65 @@ class AdafruitServerAdvertisement(Advertisement):
 class AdafruitService(Service):
     """Common superclass for all Adafruit board services."""
 
+    MEASUREMENT_PERIOD_ON_CHANGE = 0
+    """``measurement_period`` value meaning send a notification only on changes."""
+    MEASUREMENT_PERIOD_STOP = -1
+    """``measurement_period`` value meaning stop reading."""
+
+    _measurement_period_raw = None
+    _measurement_period = MEASUREMENT_PERIOD_ON_CHANGE
+    measurement_period_version = 0
+    """Incremented each time `refresh_measurement_period()` sees a new value."""
+
+    # Deadband settings (absolute, relative, heartbeat) and, per characteristic name,
+    # [last value sent, msecs when sent]. Set up by set_deadband().
+    _deadband = None
+    _deadband_sent = None
+
+    packet_queue_depth = 1
+    """For services that receive packets, such as `ToneService`: how many packets
+    can be queued before more are dropped. Set by the subclass constructor."""
+    packets_received = 0
+    """For services that receive packets: number of packets read so far."""
+    max_packets_per_drain = 0
+    """For services that receive packets: the most packets read from one packet queue
+    in a row before a read found it empty. ``_bleio`` drops writes that arrive while
+    a queue is full without counting them, so a value below `packet_queue_depth` shows
+    that nothing was dropped; a value equal to it shows the queue filled up, and writes
+    may have been lost. With the default depth of 1 every packet fills the queue.
+    `full_drains` counts how often that happened, for each packet queue.
+    """
+    # Per packet characteristic name, packets read since its queue was last found empty.
+    _packet_runs = None
+    _full_drains = None
+
     @staticmethod
     def adafruit_service_uuid(n: int) -> VendorUUID:
         """Generate a VendorUUID which fills in a 16-bit value in the standard
         Adafruit Service UUID: ADAFnnnn-C332-42A8-93BD-25E905756CB8.
+        Each value is made once and cached, so later calls return the same object.
         """
-        return VendorUUID(f"ADAF{n:04x}-C332-42A8-93BD-25E905756CB8")
+        uuid = _uuid_cache.get(n)
+        if uuid is None:
+            uuid128 = bytearray(_ADAFRUIT_UUID_BASE)
+            uuid128[12] = n & 0xFF
+            uuid128[13] = n >> 8
+            uuid = VendorUUID(uuid128)
+            _uuid_cache[n] = uuid
+        return uuid
+
+    @staticmethod
+    def adafruit_service_number(uuid: Union[UUID, _bleio.UUID]) -> Optional[int]:
+        """The reverse of `adafruit_service_uuid()`: return the 16-bit value in a
+        standard Adafruit Service UUID, or ``None`` if ``uuid`` is some other UUID.
+        """
+        bleio_uuid = getattr(uuid, "bleio_uuid", uuid)
+        if bleio_uuid.size != 128:
+            return None
+        uuid128 = bleio_uuid.uuid128
+        if uuid128[:12] != _ADAFRUIT_UUID_BASE[:12] or uuid128[14:] != _ADAFRUIT_UUID_BASE[14:]:
+            return None
+        return uuid128[12] | (uuid128[13] << 8)
 
     @classmethod
     def measurement_period_charac(cls, msecs: int = 1000) -> Int32Characteristic:
@@ -114,3 +179,113 @@ class AdafruitService(Service):
             write_perm=Attribute.NO_ACCESS,
             initial_value=version,
         )
+
+    @property
+    def full_drains(self) -> Dict[str, int]:
+        """For services that receive packets: the number of times each packet queue
+        was found full, keyed by packet characteristic name, such as ``"_tone_packet"``.
+        A queue counts once each time `packet_queue_depth` packets are read from it
+        in a row, so this counts the drains in which writes may have been lost,
+        and stays empty while nothing was dropped.
+        """
+        full_drains = self._full_drains
+        if full_drains is None:
+            full_drains = self._full_drains = {}
+        return full_drains
+
+    def _count_packet(self, name: str, num_read: int) -> int:
+        """Update the packet queue statistics after reading from the packet
+        characteristic ``name``. Return ``num_read``.
+        """
+        runs = self._packet_runs
+        if runs is None:
+            runs = self._packet_runs = {}
+        if num_read == 0:
+            runs[name] = 0
+            return num_read
+        self.packets_received += 1
+        run = runs.get(name, 0) + 1
+        self.max_packets_per_drain = max(self.max_packets_per_drain, run)
+        if run == self.packet_queue_depth:
+            full_drains = self.full_drains
+            full_drains[name] = full_drains.get(name, 0) + 1
+        runs[name] = run
+        return num_read
+
+    @property
+    def cached_measurement_period(self) -> int:
+        """``measurement_period`` as of the last call to `refresh_measurement_period()`.
+        Reading this does not access the characteristic. Services without a
+        ``measurement_period`` characteristic report `MEASUREMENT_PERIOD_ON_CHANGE`.
+        """
+        if self._measurement_period_raw is None:
+            self.refresh_measurement_period()
+        return self._measurement_period
+
+    def refresh_measurement_period(self) -> bool:
+        """Check whether ``measurement_period`` has been written, by the client or locally,
+        since the last check, and update `cached_measurement_period` if so.
+        Only the raw bytes are compared; they are unpacked only when they have changed.
+        Return ``True`` if the value changed.
+        """
+        characteristic = self.bleio_characteristics.get("measurement_period")
+        if characteristic is None:
+            # This service has no measurement_period, or it is not bound yet.
+            return False
+        raw = characteristic.value
+        if raw == self._measurement_period_raw:
+            return False
+        self._measurement_period_raw = bytes(raw)
+        self._measurement_period = struct.unpack("<i", raw)[0]
+        self.measurement_period_version += 1
+        return True
+
+    def set_deadband(
+        self, *, absolute: float = 0.0, relative: float = 0.0, heartbeat: Optional[int] = None
+    ) -> None:
+        """Make `update()` skip writes whose values are too close to the last value sent.
+
+        :param float absolute: send only if some element of the value changed by more than this.
+        :param float relative: send only if some element of the value changed by more than
+          this fraction of the largest magnitude in the last value sent.
+        :param int heartbeat: send anyway if nothing has been sent for this many msecs,
+          so a client can tell a quiet sensor from a dead one. ``None`` means never.
+        """
+        self._deadband = (absolute, relative, heartbeat)
+        self._deadband_sent = {}
+
+    def update(self, name: str, value: Any) -> bool:
+        """Set the characteristic ``name``, such as ``"temperature"`` or ``"reading"``,
+        to ``value``, unless the change is within the deadband set by `set_deadband()`.
+        Without a deadband, the value is always set.
+        Return ``True`` if the value was set and so sent to the client.
+        """
+        deadband = self._deadband
+        if deadband is None:
+            setattr(self, name, value)
+            return True
+        now_msecs = time.monotonic_ns() // 1000000
+        sent = self._deadband_sent.get(name)
+        if sent is not None:
+            last_value, last_msecs = sent
+            absolute, relative, heartbeat = deadband
+            quiet_too_long = heartbeat is not None and now_msecs - last_msecs >= heartbeat
+            if not quiet_too_long and not _outside_deadband(last_value, value, absolute, relative):
+                return False
+        setattr(self, name, value)
+        self._deadband_sent[name] = (value, now_msecs)
+        return True
+
+
+def _outside_deadband(old: Any, new: Any, absolute: float, relative: float) -> bool:
+    if isinstance(new, (int, float)):
+        old = (old,)
+        new = (new,)
+    elif not isinstance(new, tuple):
+        # Not numbers, such as a buffer of samples, which may be reused: always send.
+        return True
+    threshold = max(absolute, relative * max(abs(x) for x in old))
+    for old_x, new_x in zip(old, new):
+        if abs(new_x - old_x) > threshold:
+            return True
+    return False
@@ -25,7 +25,9 @@ from adafruit_ble.characteristics.int import Uint8Characteristic, Uint16Characte
 from adafruit_ble_adafruit.adafruit_service import AdafruitService
 
 try:
-    from typing import Optional
+    from typing import Iterable, List, Optional, Sequence, Tuple
+
+    from circuitpython_typing import WriteableBuffer
 except ImportError:
     pass
 
@@ -55,7 +57,9 @@ class _PixelPacket(ComplexCharacteristic):
     start: uint16: start writing data into buffer at this byte number (byte, not pixel)
     flags: uint8: bit 0: 0 = don't write to pixels yet
                          1 = write entire buffer to pixels now
-    data: raw array of data for all pixels, in proper color order for type of pixel
+                  bits 1-3: packet format; see AddressablePixelService.RAW, etc.
+    data: raw array of data for all pixels, in proper color order for type of pixel,
+          or data in the packet format given by the flags
     """
 
     MAX_LENGTH = 512
@@ -72,12 +76,29 @@ class _PixelPacket(ComplexCharacteristic):
     def bind(self, service: "AddressablePixelService") -> _bleio.PacketBuffer:
         """Binds the characteristic to the given Service."""
         bound_characteristic = super().bind(service)
-        return _bleio.PacketBuffer(bound_characteristic, buffer_size=1)
+        return _bleio.PacketBuffer(bound_characteristic, buffer_size=service.packet_queue_depth)
 
 
 class AddressablePixelService(AdafruitService):
     """Control of NeoPixels, DotStars, etc."""
 
+    RAW = 0
+    """Packet format: data is raw pixel bytes."""
+    FILL = 1
+    """Packet format: data is bytes_per_pixel: uint8, count: uint16, then one pixel,
+    repeated count times."""
+    RUN_LENGTH = 2
+    """Packet format: data is bytes_per_pixel: uint8, then runs of
+    (run length: uint8, one pixel)."""
+    PALETTE_INDEXED = 3
+    """Packet format: data is one uint8 palette index per pixel."""
+    PALETTE = 4
+    """Packet format: data is bytes_per_pixel: uint8, then palette entries.
+    ``start`` is the index of the first palette entry set, not a byte number."""
+
+    PALETTE_SIZE = 256
+    """Number of palette entries."""
+
     uuid = AdafruitService.adafruit_service_uuid(0x900)
     pixel_pin = Uint8Characteristic(
         uuid=AdafruitService.adafruit_service_uuid(0x901),
@@ -103,17 +124,29 @@ class AddressablePixelService(AdafruitService):
     _pixel_packet = _PixelPacket()
     """Pixel-setting data."""
 
-    def __init__(self, service: Optional["AddressablePixelService"] = None) -> None:
+    def __init__(
+        self, service: Optional["AddressablePixelService"] = None, *, packet_queue_depth: int = 1
+    ) -> None:
         self._pixel_packet_buf = bytearray(_PixelPacket.MAX_LENGTH)
+        self._pixel_packet_view = memoryview(self._pixel_packet_buf)
+        # Byte range written by the last readinto_pixels().
+        self._last_start = 0
+        self._last_end = 0
+        # Allocated when a client first sends a PALETTE packet.
+        self._palette = None
+        self._palette_bytes_per_pixel = 0
+        # Use more than 1 if clients send frames in several packets.
+        self.packet_queue_depth = packet_queue_depth
         super().__init__(service=service)
 
     @property
     def values(self) -> Optional[PixelValues]:
         """Return a tuple (start, write_now, data) corresponding to the
-        different parts of ``_pixel_packet``.
+        different parts of ``_pixel_packet``. ``data`` is not decoded, so this is
+        useful only for `RAW` packets; use `readinto_pixels()` to handle all formats.
         """
         buf = self._pixel_packet_buf
-        num_read = self._pixel_packet.readinto(buf)
+        num_read = self._count_packet("_pixel_packet", self._pixel_packet.readinto(buf))
         if num_read == 0:
             # No new values available
             return None
@@ -123,3 +156,357 @@ class AddressablePixelService(AdafruitService):
             bool(buf[2] & 0x1),
             buf[3:num_read],
         )
+
+    def readinto_pixels(self, pixel_buffer: WriteableBuffer) -> Optional[bool]:
+        """Copy the data from the next ``_pixel_packet``, if any, straight into
+        ``pixel_buffer`` at the packet's ``start`` offset. Data that would go past
+        the end of ``pixel_buffer`` is dropped. Unlike `values`, no new buffers are made.
+
+        Return ``None`` if no new packet is available; otherwise return ``write_now``:
+        ``True`` if ``pixel_buffer`` should be written to the pixels now.
+        """
+        buf = self._pixel_packet_buf
+        num_read = self._count_packet("_pixel_packet", self._pixel_packet.readinto(buf))
+        if num_read == 0:
+            # No new values available
+            return None
+
+        start = buf[0] | (buf[1] << 8)
+        packet_format = (buf[2] >> 1) & 0x7
+        if packet_format == self.RAW:
+            data_len = min(num_read - 3, len(pixel_buffer) - start)
+            if data_len > 0:
+                pixel_buffer[start : start + data_len] = self._pixel_packet_view[3 : 3 + data_len]
+            end = start + max(data_len, 0)
+        else:
+            end = self._decode_packet(packet_format, start, num_read, pixel_buffer)
+        self._last_start = start
+        self._last_end = end
+        return bool(buf[2] & 0x1)
+
+    def _decode_packet(
+        self, packet_format: int, start: int, num_read: int, pixel_buffer: WriteableBuffer
+    ) -> int:
+        """Decode a compressed packet into pixel_buffer. Return the end of the bytes written."""
+        buf = self._pixel_packet_buf
+        view = self._pixel_packet_view
+        limit = len(pixel_buffer)
+        position = start
+        if packet_format == self.PALETTE_INDEXED:
+            palette = self._palette
+            bpp = self._palette_bytes_per_pixel
+            if palette is None:
+                return start
+            for i in range(3, num_read):
+                if position + bpp > limit:
+                    break
+                entry = buf[i] * bpp
+                pixel_buffer[position : position + bpp] = palette[entry : entry + bpp]
+                position += bpp
+            return position
+
+        bpp = buf[3]
+        if bpp == 0:
+            return start
+        if packet_format == self.PALETTE:
+            if self._palette is None or bpp != self._palette_bytes_per_pixel:
+                self._palette = bytearray(self.PALETTE_SIZE * bpp)
+                self._palette_bytes_per_pixel = bpp
+            entries = min(num_read - 4, (self.PALETTE_SIZE - start) * bpp)
+            if entries > 0:
+                offset = start * bpp
+                self._palette[offset : offset + entries] = view[4 : 4 + entries]
+            # The pixels themselves are unchanged.
+            return start
+
+        if packet_format == self.FILL:
+            count = buf[4] | (buf[5] << 8)
+            pixel = view[6 : 6 + bpp]
+            for _ in range(count):
+                if position + bpp > limit:
+                    break
+                pixel_buffer[position : position + bpp] = pixel
+                position += bpp
+        elif packet_format == self.RUN_LENGTH:
+            i = 4
+            while i + bpp < num_read:
+                pixel = view[i + 1 : i + 1 + bpp]
+                for _ in range(buf[i]):
+                    if position + bpp > limit:
+                        return position
+                    pixel_buffer[position : position + bpp] = pixel
+                    position += bpp
+                i += 1 + bpp
+        return position
+
+    def write_packets(self, packets: Iterable[bytes]) -> None:
+        """Send packets made by `encode_pixel_packets()` or `encode_palette_packets()`
+        to the server. For use by clients.
+        """
+        for packet in packets:
+            self._pixel_packet.write(packet)
+
+    @classmethod
+    def encode_palette_packets(cls, palette: Sequence[bytes]) -> List[bytes]:
+        """Encode a palette, a sequence of up to `PALETTE_SIZE` pixels,
+        each a bytes object of the same length, as `PALETTE` packets.
+        """
+        bpp = len(palette[0])
+        per_packet = (_PixelPacket.MAX_LENGTH - 4) // bpp
+        packets = []
+        for first in range(0, len(palette), per_packet):
+            entries = palette[first : first + per_packet]
+            packets.append(struct.pack("<HBB", first, cls.PALETTE << 1, bpp) + b"".join(entries))
+        return packets
+
+    @classmethod
+    def encode_pixel_packets(
+        cls,
+        pixels: bytes,
+        bytes_per_pixel: int,
+        *,
+        start: int = 0,
+        write_now: bool = True,
+        palette: Optional[Sequence[bytes]] = None,
+    ) -> List[bytes]:
+        """Encode pixel data to be written at byte ``start`` as the smallest list of
+        packets among the `RAW`, `FILL`, `RUN_LENGTH` and, if ``palette`` is given and
+        contains every pixel, `PALETTE_INDEXED` formats.
+        ``write_now`` is set only in the last packet.
+        The palette must already have been sent with `encode_palette_packets()`.
+        """
+        bpp = bytes_per_pixel
+        # bytes, not bytearray slices, so pixels can be looked up in the palette.
+        pixel_list = [bytes(pixels[i : i + bpp]) for i in range(0, len(pixels), bpp)]
+        candidates = [cls._raw_packets(pixels, bpp, start)]
+        runs = []
+        for pixel in pixel_list:
+            if runs and runs[-1][1] == pixel and runs[-1][0] < 255:
+                runs[-1][0] += 1
+            else:
+                runs.append([1, pixel])
+        if pixel_list and all(pixel == pixel_list[0] for pixel in pixel_list):
+            candidates.append(
+                [struct.pack("<HBBH", start, cls.FILL << 1, bpp, len(pixel_list)) + pixel_list[0]]
+            )
+        candidates.append(cls._run_length_packets(runs, bpp, start))
+        if palette is not None:
+            indices = {bytes(entry): index for index, entry in enumerate(palette)}
+            if all(pixel in indices for pixel in pixel_list):
+                candidates.append(cls._indexed_packets(pixel_list, indices, bpp, start))
+        packets = min(candidates, key=lambda packets: sum(len(p) for p in packets))
+        if write_now and packets:
+            packets[-1] = packets[-1][:2] + bytes((packets[-1][2] | 0x1,)) + packets[-1][3:]
+        return packets
+
+    @classmethod
+    def _raw_packets(cls, pixels: bytes, bpp: int, start: int) -> List[bytes]:
+        per_packet = (_PixelPacket.MAX_LENGTH - 3) // bpp * bpp
+        return [
+            struct.pack("<HB", start + offset, cls.RAW) + pixels[offset : offset + per_packet]
+            for offset in range(0, len(pixels), per_packet)
+        ]
+
+    @classmethod
+    def _run_length_packets(cls, runs: List[List], bpp: int, start: int) -> List[bytes]:
+        packets = []
+        data = []
+        data_len = 0
+        packet_start = start
+        position = start
+        for count, pixel in runs:
+            if data and 4 + data_len + 1 + bpp > _PixelPacket.MAX_LENGTH:
+                packets.append(
+                    struct.pack("<HBB", packet_start, cls.RUN_LENGTH << 1, bpp) + b"".join(data)
+                )
+                data = []
+                data_len = 0
+                packet_start = position
+            data.append(bytes((count,)) + pixel)
+            data_len += 1 + bpp
+            position += count * bpp
+        if data:
+            packets.append(
+                struct.pack("<HBB", packet_start, cls.RUN_LENGTH << 1, bpp) + b"".join(data)
+            )
+        return packets
+
+    @classmethod
+    def _indexed_packets(
+        cls, pixel_list: List[bytes], indices: dict, bpp: int, start: int
+    ) -> List[bytes]:
+        per_packet = _PixelPacket.MAX_LENGTH - 3
+        return [
+            struct.pack("<HB", start + first * bpp, cls.PALETTE_INDEXED << 1)
+            + bytes(indices[pixel] for pixel in pixel_list[first : first + per_packet])
+            for first in range(0, len(pixel_list), per_packet)
+        ]
+
+
+class PixelFrameAssembler:
+    """Collect pixel packets from an `AddressablePixelService` into a frame,
+    keeping track of which bytes of the frame have arrived.
+
+    :param AddressablePixelService service: the service receiving pixel packets.
+      Give it a ``packet_queue_depth`` large enough to hold a whole frame's worth of packets.
+    :param pixel_buffer: the buffer that holds the frame.
+    :param bool require_complete: if ``True``, a ``write_now`` request is held back
+      until every byte of the frame has arrived, to avoid showing half-written frames.
+    """
+
+    def __init__(
+        self,
+        service: AddressablePixelService,
+        pixel_buffer: WriteableBuffer,
+        *,
+        require_complete: bool = False,
+    ) -> None:
+        self._service = service
+        self._pixel_buffer = pixel_buffer
+        self.require_complete = require_complete
+        # Sorted, non-overlapping [start, end) byte ranges received for this frame.
+        self._received = []
+        self._write_pending = False
+        self._frame_size = 0
+        self._start_frame()
+
+    def _start_frame(self) -> None:
+        self._received.clear()
+        self._write_pending = False
+        # The client may change pixel_buffer_size between frames.
+        self._frame_size = min(len(self._pixel_buffer), self._service.pixel_buffer_size)
+
+    def _mark_received(self, start: int, end: int) -> None:
+        # Bytes past the end of the frame do not count towards it.
+        end = min(end, self._frame_size)
+        if start >= end:
+            return
+        merged = []
+        for range_start, range_end in self._received:
+            if range_end < start or range_start > end:
+                merged.append((range_start, range_end))
+            else:
+                start = min(start, range_start)
+                end = max(end, range_end)
+        merged.append((start, end))
+        merged.sort()
+        self._received = merged
+
+    @property
+    def frame_size(self) -> int:
+        """Number of bytes in a complete frame: the smaller of the pixel buffer's length
+        and the service's ``pixel_buffer_size``, as of the start of the frame.
+        """
+        return self._frame_size
+
+    @property
+    def complete(self) -> bool:
+        """``True`` if every byte of the current frame has arrived."""
+        return not self.missing
+
+    @property
+    def missing(self) -> List[Tuple[int, int]]:
+        """List of (start, end) byte ranges of the current frame that have not arrived."""
+        gaps = []
+        position = 0
+        for start, end in self._received:
+            gap_end = min(start, self._frame_size)
+            if gap_end > position:
+                gaps.append((position, gap_end))
+            position = max(position, end)
+        if position < self._frame_size:
+            gaps.append((position, self._frame_size))
+        return gaps
+
+    def poll(self) -> bool:
+        """Copy all queued pixel packets into the pixel buffer.
+        Return ``True`` when the frame should be written to the pixels now;
+        the next packets then start a new frame.
+        """
+        service = self._service
+        pixel_buffer = self._pixel_buffer
+        while True:
+            write_now = service.readinto_pixels(pixel_buffer)
+            if write_now is None:
+                break
+            self._mark_received(service._last_start, service._last_end)
+            if write_now:
+                self._write_pending = True
+            if self._write_pending and (not self.require_complete or self.complete):
+                self._start_frame()
+                return True
+        return False
+
+
+class PixelDiffSender:
+    """For clients: send only the parts of a pixel buffer that have changed since
+    the last send, using ``start`` offsets, followed by a single ``write_now``.
+
+    :param AddressablePixelService service: the remote service.
+    :param int size: size of the pixel buffer, in bytes.
+    :param int bytes_per_pixel: 3 for RGB, 4 for RGBW, etc.
+    :param int merge_gap: changed ranges separated by this many unchanged bytes or fewer
+      are sent as one range, since resending a few bytes is cheaper than another packet.
+    """
+
+    def __init__(
+        self,
+        service: AddressablePixelService,
+        size: int,
+        bytes_per_pixel: int = 3,
+        *,
+        merge_gap: int = 6,
+    ) -> None:
+        self._service = service
+        self._bytes_per_pixel = bytes_per_pixel
+        self.merge_gap = merge_gap
+        self._shadow = bytearray(size)
+        # The server's buffer contents are unknown until the first full send.
+        self._synced = False
+
+    def dirty_ranges(self, pixels: bytes) -> List[Tuple[int, int]]:
+        """Return the (start, end) byte ranges, aligned to whole pixels,
+        where ``pixels`` differs from what was last sent.
+        """
+        bpp = self._bytes_per_pixel
+        shadow = self._shadow
+        if not self._synced:
+            return [(0, len(shadow))]
+        ranges = []
+        for position in range(0, len(shadow), bpp):
+            end = position + bpp
+            if pixels[position:end] == shadow[position:end]:
+                continue
+            if ranges and position - ranges[-1][1] <= self.merge_gap:
+                ranges[-1][1] = end
+            else:
+                ranges.append([position, end])
+        return [(start, end) for start, end in ranges]
+
+    def send(self, pixels: bytes, *, palette: Optional[Sequence[bytes]] = None) -> int:
+        """Send the changed parts of ``pixels``, and then have the server write its buffer
+        to the pixels. Each changed range is encoded with
+        `AddressablePixelService.encode_pixel_packets()`. Return the number of packets sent.
+        """
+        service = self._service
+        bpp = self._bytes_per_pixel
+        packets = []
+        for start, end in self.dirty_ranges(pixels):
+            packets.extend(
+                service.encode_pixel_packets(
+                    bytes(pixels[start:end]), bpp, start=start, write_now=False, palette=palette
+                )
+            )
+        if packets:
+            last = packets[-1]
+            packets[-1] = last[:2] + bytes((last[2] | 0x1,)) + last[3:]
+            service.write_packets(packets)
+        self._shadow[:] = pixels
+        self._synced = True
+        return len(packets)
+
+    def invalidate(self) -> None:
+        """Forget what the server has, so the next `send()` sends the whole buffer,
+        for example after reconnecting.
+        """
+        self._synced = False
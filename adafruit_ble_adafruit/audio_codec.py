@@ -0,0 +1,219 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.audio_codec`
+================================================================================
+
+Compressed encodings for 16-bit sound samples: 8-bit µ-law and 4-bit IMA-ADPCM.
+Written in plain Python so the same code runs on CircuitPython servers
+and CPython clients.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import struct
+from array import array
+
+try:
+    from typing import Optional, Sequence
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+PCM16 = 0
+"""Uncompressed little-endian signed 16-bit samples: 2 bytes per sample."""
+MULAW = 1
+"""G.711 µ-law: 1 byte per sample."""
+IMA_ADPCM = 2
+"""IMA-ADPCM: a 4-byte header (predictor: int16, step index: uint8, flags: uint8),
+then 4 bits per sample, low nibble first. Bit 0 of flags is set when the number of
+samples is odd, so the last 4 bits are padding. Each block can be decoded on its own."""
+
+_MULAW_BIAS = 0x84
+_MULAW_CLIP = 32635
+
+_ADPCM_HEADER_FORMAT = "<hBB"
+_ADPCM_ODD = 0x01
+_ADPCM_HEADER_SIZE = struct.calcsize(_ADPCM_HEADER_FORMAT)
+
+_ADPCM_INDEX_TABLE = (-1, -1, -1, -1, 2, 4, 6, 8)
+_ADPCM_STEP_TABLE = (
+    7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37, 41, 45,
+    50, 55, 60, 66, 73, 80, 88, 97, 107, 118, 130, 143, 157, 173, 190, 209, 230,
+    253, 279, 307, 337, 371, 408, 449, 494, 544, 598, 658, 724, 796, 876, 963,
+    1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066, 2272, 2499, 2749, 3024, 3327,
+    3660, 4026, 4428, 4871, 5358, 5894, 6484, 7132, 7845, 8630, 9493, 10442, 11487,
+    12635, 13899, 15289, 16818, 18500, 20350, 22385, 24623, 27086, 29794, 32767,
+)  # fmt: skip
+
+
+class AdpcmState:
+    """IMA-ADPCM encoder state, carried from one block to the next so that
+    consecutive blocks continue smoothly.
+    """
+
+    def __init__(self, predictor: int = 0, index: int = 0) -> None:
+        self.predictor = predictor
+        self.index = index
+
+
+def encoded_size(count: int, codec: int) -> int:
+    """Number of bytes needed to encode ``count`` samples with ``codec``."""
+    if codec == PCM16:
+        return 2 * count
+    if codec == MULAW:
+        return count
+    if codec == IMA_ADPCM:
+        return _ADPCM_HEADER_SIZE + (count + 1) // 2
+    raise ValueError("unknown codec")
+
+
+def samples_in(size: int, codec: int) -> int:
+    """Largest number of samples that ``codec`` can encode in ``size`` bytes.
+    For `IMA_ADPCM` this is always even.
+    """
+    if codec == PCM16:
+        return size // 2
+    if codec == MULAW:
+        return size
+    if codec == IMA_ADPCM:
+        return max(0, 2 * (size - _ADPCM_HEADER_SIZE))
+    raise ValueError("unknown codec")
+
+
+def sample_count(data: ReadableBuffer, codec: int) -> int:
+    """Number of samples in ``data`` encoded with ``codec``."""
+    if codec == IMA_ADPCM:
+        if len(data) < _ADPCM_HEADER_SIZE:
+            return 0
+        return samples_in(len(data), codec) - (data[3] & _ADPCM_ODD)
+    return samples_in(len(data), codec)
+
+
+def _mulaw_encode_sample(sample: int) -> int:
+    sign = 0x80 if sample < 0 else 0
+    if sign:
+        sample = -sample
+    sample = min(sample, _MULAW_CLIP) + _MULAW_BIAS
+    exponent = 7
+    mask = 0x4000
+    while exponent > 0 and not sample & mask:
+        exponent -= 1
+        mask >>= 1
+    mantissa = (sample >> (exponent + 3)) & 0x0F
+    return ~(sign | (exponent << 4) | mantissa) & 0xFF
+
+
+def _mulaw_decode_byte(byte: int) -> int:
+    byte = ~byte & 0xFF
+    exponent = (byte >> 4) & 0x07
+    sample = ((((byte & 0x0F) << 3) + _MULAW_BIAS) << exponent) - _MULAW_BIAS
+    return -sample if byte & 0x80 else sample
+
+
+def encode_into(
+    buffer: WriteableBuffer,
+    offset: int,
+    samples: Sequence[int],
+    codec: int,
+    state: Optional[AdpcmState] = None,
+) -> int:
+    """Encode signed 16-bit ``samples`` with ``codec`` into ``buffer`` starting at ``offset``.
+    For `IMA_ADPCM`, ``state`` carries the encoder state from the previous block;
+    without it, each block starts from silence.
+    Return the number of bytes written.
+    """
+    count = len(samples)
+    if codec == PCM16:
+        for i in range(count):
+            struct.pack_into("<h", buffer, offset + 2 * i, samples[i])
+        return 2 * count
+    if codec == MULAW:
+        for i in range(count):
+            buffer[offset + i] = _mulaw_encode_sample(samples[i])
+        return count
+    if codec != IMA_ADPCM:
+        raise ValueError("unknown codec")
+
+    if state is None:
+        state = AdpcmState()
+    predictor = state.predictor
+    index = state.index
+    struct.pack_into(
+        _ADPCM_HEADER_FORMAT, buffer, offset, predictor, index, _ADPCM_ODD if count & 1 else 0
+    )
+    position = offset + _ADPCM_HEADER_SIZE
+    for i in range(count):
+        step = _ADPCM_STEP_TABLE[index]
+        diff = samples[i] - predictor
+        nibble = 0
+        if diff < 0:
+            nibble = 8
+            diff = -diff
+        delta = step >> 3
+        if diff >= step:
+            nibble |= 4
+            diff -= step
+            delta += step
+        step >>= 1
+        if diff >= step:
+            nibble |= 2
+            diff -= step
+            delta += step
+        step >>= 1
+        if diff >= step:
+            nibble |= 1
+            delta += step
+        predictor = max(-32768, min(32767, predictor - delta if nibble & 8 else predictor + delta))
+        index = max(0, min(88, index + _ADPCM_INDEX_TABLE[nibble & 7]))
+        if i & 1:
+            buffer[position] |= nibble << 4
+            position += 1
+        else:
+            buffer[position] = nibble
+    if count & 1:
+        position += 1
+    state.predictor = predictor
+    state.index = index
+    return position - offset
+
+
+def encode(samples: Sequence[int], codec: int, state: Optional[AdpcmState] = None) -> bytearray:
+    """Encode signed 16-bit ``samples`` with ``codec`` and return the encoded bytes."""
+    buffer = bytearray(encoded_size(len(samples), codec))
+    encode_into(buffer, 0, samples, codec, state)
+    return buffer
+
+
+def decode(data: ReadableBuffer, codec: int) -> array:
+    """Decode ``data`` encoded with ``codec`` into an ``array("h")`` of samples."""
+    if codec == PCM16:
+        return array("h", struct.unpack_from(f"<{len(data) // 2}h", data))
+    if codec == MULAW:
+        return array("h", [_mulaw_decode_byte(byte) for byte in data])
+    if codec != IMA_ADPCM:
+        raise ValueError("unknown codec")
+
+    predictor, index, _ = struct.unpack_from(_ADPCM_HEADER_FORMAT, data)
+    samples = array("h", [0] * sample_count(data, IMA_ADPCM))
+    for i in range(len(samples)):
+        byte = data[_ADPCM_HEADER_SIZE + (i >> 1)]
+        nibble = (byte >> 4) if i & 1 else (byte & 0x0F)
+        step = _ADPCM_STEP_TABLE[index]
+        delta = step >> 3
+        if nibble & 4:
+            delta += step
+        if nibble & 2:
+            delta += step >> 1
+        if nibble & 1:
+            delta += step >> 2
+        predictor = max(-32768, min(32767, predictor - delta if nibble & 8 else predictor + delta))
+        index = max(0, min(88, index + _ADPCM_INDEX_TABLE[nibble & 7]))
+        samples[i] = predictor
+    return samples
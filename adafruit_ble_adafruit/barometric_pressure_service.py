@@ -19,9 +19,10 @@ from adafruit_ble.characteristics import Characteristic
 from adafruit_ble.characteristics.float import FloatCharacteristic
 
 from adafruit_ble_adafruit.adafruit_service import AdafruitService
+from adafruit_ble_adafruit.sensor_reading import SensorReadingMixin
 
 
-class BarometricPressureService(AdafruitService):
+class BarometricPressureService(SensorReadingMixin, AdafruitService):
     """Barometric pressure value."""
 
     uuid = AdafruitService.adafruit_service_uuid(0x800)
@@ -33,3 +34,12 @@ class BarometricPressureService(AdafruitService):
     """Barometric pressure in hectoPascals (hPa) (float)"""
     measurement_period = AdafruitService.measurement_period_charac()
     """Initially 1000ms."""
+
+    _reading_name = "pressure"
+    _reading_count = 1
+    encoding = SensorReadingMixin.encoding_charac()
+    """`CompactEncoding` used by `reading`. Initially 0: floats in ``pressure``."""
+    encoding_scale = SensorReadingMixin.encoding_scale_charac(0.1)
+    """(scale, offset) of the compact encoding: one step is 0.1 hPa."""
+    compact = SensorReadingMixin.compact_charac()
+    """``pressure`` in the compact `encoding`, when the client has chosen one."""
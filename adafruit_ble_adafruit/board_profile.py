@@ -0,0 +1,381 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.board_profile`
+================================================================================
+
+Declarative tables of the services a board offers, with ready-made profiles for
+the CLUE, Circuit Playground Bluefruit and Feather Bluefruit Sense.
+A `BoardServer` builds the services from a profile and keeps them updated.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+from adafruit_ble_adafruit import load_service
+from adafruit_ble_adafruit.adafruit_service import AdafruitServerAdvertisement
+from adafruit_ble_adafruit.sensor_scheduler import SensorScheduler
+
+try:
+    from typing import Any, Callable, Dict, Optional, Sequence, Type, Union
+
+    from adafruit_ble import BLERadio
+    from circuitpython_typing import WriteableBuffer
+
+    from adafruit_ble_adafruit.adafruit_service import AdafruitService
+except ImportError:
+    pass
+
+
+class SensorSpec:
+    """One row of a board profile: a sensor service and how to update it.
+
+    :param service_class: the service class, such as `TemperatureService`, or its name,
+      such as ``"TemperatureService"``. A name is looked up with
+      `adafruit_ble_adafruit.load_service()` when a `BoardServer` is built, so only the
+      services a board uses are imported. A `BoardServer` makes one instance per class,
+      shared by all the rows that name it.
+    :param str characteristic: what to set from the value returned by ``reader``:
+      a characteristic name, such as ``"reading"`` or ``"pressed"``, or the name of a
+      service method that takes the value, such as ``"set_sound_samples"``.
+    :param reader: a callable with no arguments that reads the sensor.
+    :param int period: initial ``measurement_period`` in msecs, or ``None`` to keep
+      the service's own default.
+    :param int encoding: initial ``encoding``, such as `CompactEncoding.INT16`, or ``None``
+      to keep the service's default. The client can still change it.
+    :param dict settings: other characteristics to set once, by name,
+      such as ``{"number_of_channels": 1}``.
+    """
+
+    def __init__(
+        self,
+        service_class: Union[Type[AdafruitService], str],
+        characteristic: str,
+        reader: Callable[[], Any],
+        period: Optional[int] = None,
+        encoding: Optional[int] = None,
+        settings: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.service_class = service_class
+        self.characteristic = characteristic
+        self.reader = reader
+        self.period = period
+        self.encoding = encoding
+        self.settings = settings
+
+
+class BoardProfile:
+    """The services a board offers.
+
+    :param str name: the BLE name, used by the Web Bluetooth dashboard to identify the board.
+    :param int pid: the USB PID advertised in `AdafruitServerAdvertisement`, used by
+      the Bluefruit Playground app to identify the board.
+    :param Sequence[SensorSpec] sensors: the sensor services.
+    :param int pixel_count: number of addressable pixels, or 0 for none.
+    :param show_pixels: called with the pixel buffer to write it to the pixels.
+    :param start_tone: called with a frequency in Hz to start a tone, or ``None`` if
+      the board cannot play tones.
+    :param stop_tone: called to stop a tone.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        pid: int,
+        sensors: Sequence[SensorSpec],
+        *,
+        pixel_count: int = 0,
+        show_pixels: Optional[Callable[[WriteableBuffer], None]] = None,
+        start_tone: Optional[Callable[[int], None]] = None,
+        stop_tone: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self.name = name
+        self.pid = pid
+        self.sensors = sensors
+        self.pixel_count = pixel_count
+        self.show_pixels = show_pixels
+        self.start_tone = start_tone
+        self.stop_tone = stop_tone
+
+
+class BoardServer:
+    """Build the services in a `BoardProfile` and keep them updated with a
+    `SensorScheduler`, so that every board gets the same scheduling, deadbands and
+    encodings instead of each program updating its services its own way.
+
+    :param BoardProfile profile: the board's services.
+    :param int bytes_per_pixel: bytes per pixel in the pixel buffer: 3 for RGB.
+    """
+
+    def __init__(self, profile: BoardProfile, *, bytes_per_pixel: int = 3) -> None:
+        self.profile = profile
+        self.scheduler = SensorScheduler()
+        self.services = []
+        """The services, in the order they were first named in the profile."""
+        for spec in profile.sensors:
+            service_class = spec.service_class
+            if isinstance(service_class, str):
+                service_class = load_service(service_class)
+            service = self.service(service_class)
+            if service is None:
+                service = service_class()
+                self.services.append(service)
+            if spec.period is not None:
+                service.measurement_period = spec.period
+            if spec.encoding is not None:
+                service.encoding = spec.encoding
+            if spec.settings:
+                for name, value in spec.settings.items():
+                    setattr(service, name, value)
+            setter = getattr(type(service), spec.characteristic, None)
+            if callable(setter):
+                self.scheduler.add(service, None, _method_reader(service, setter, spec.reader))
+            else:
+                self.scheduler.add(service, spec.characteristic, spec.reader)
+
+        self.pixel_buffer = None
+        """Pixel values sent by the client, or ``None`` if the board has no pixels."""
+        self._pixel_service = None
+        if profile.pixel_count:
+            self._pixel_service = load_service("AddressablePixelService")()
+            self.services.append(self._pixel_service)
+            self.pixel_buffer = bytearray(bytes_per_pixel * profile.pixel_count)
+
+        self._tone_player = None
+        if profile.start_tone is not None:
+            from adafruit_ble_adafruit.tone_service import TonePlayer, ToneService
+
+            tone_service = ToneService()
+            self.services.append(tone_service)
+            self._tone_player = TonePlayer(tone_service, profile.start_tone, profile.stop_tone)
+
+    def service(
+        self, service_class: Union[Type[AdafruitService], str]
+    ) -> Optional[AdafruitService]:
+        """The instance of ``service_class``, which may also be given by name,
+        or ``None`` if the profile does not include it.
+        """
+        if isinstance(service_class, str):
+            for service in self.services:
+                if type(service).__name__ == service_class:
+                    return service
+            return None
+        for service in self.services:
+            if type(service) is service_class:
+                return service
+        return None
+
+    @property
+    def advertisement(self) -> AdafruitServerAdvertisement:
+        """An advertisement with the board's PID."""
+        adv = AdafruitServerAdvertisement()
+        adv.pid = self.profile.pid
+        return adv
+
+    def poll_inputs(self) -> None:
+        """Handle any pixel and tone writes from the client."""
+        pixel_service = self._pixel_service
+        if pixel_service is not None:
+            pixel_buffer = self.pixel_buffer
+            while True:
+                write_now = pixel_service.readinto_pixels(pixel_buffer)
+                if write_now is None:
+                    break
+                if write_now:
+                    self.profile.show_pixels(pixel_buffer)
+        if self._tone_player is not None:
+            self._tone_player.update()
+
+    def run(self, ble: BLERadio, *, input_poll_period: int = 10) -> None:
+        """Advertise, and update the services while a client is connected, forever.
+
+        :param BLERadio ble: the radio.
+        :param int input_poll_period: check for pixel and tone writes at least
+          this often, in msecs.
+        """
+        ble.name = self.profile.name
+        adv = self.advertisement
+        while True:
+            # Advertise when not connected.
+            ble.start_advertising(adv)
+            while not ble.connected:
+                pass
+            ble.stop_advertising()
+
+            while ble.connected:
+                self.scheduler.sleep_until_due(input_poll_period)
+                self.poll_inputs()
+
+
+def _method_reader(
+    service: AdafruitService, method: Callable, reader: Callable[[], Any]
+) -> Callable[[], None]:
+    return lambda: method(service, reader())
+
+
+def _pressed(switch: bool, button_a: bool, button_b: bool) -> int:
+    """The `ButtonService.pressed` bits for the given states."""
+    return (0x1 if switch else 0) | (0x2 if button_a else 0) | (0x4 if button_b else 0)
+
+
+def _neopixel_writer(pin: Any) -> Callable[[WriteableBuffer], None]:
+    import neopixel_write
+    from digitalio import DigitalInOut
+
+    neopixel_out = DigitalInOut(pin)
+    neopixel_out.switch_to_output()
+    return lambda buf: neopixel_write.neopixel_write(neopixel_out, buf)
+
+
+def _mic_reader(record: Callable[[Any, int], None], count: int) -> Callable[[], Any]:
+    from ulab import numpy as np
+
+    samples = np.zeros(count, dtype=np.uint16)
+    # The same memory as samples, read as signed: ulab has no int32 to subtract in.
+    signed = np.frombuffer(samples, dtype=np.int16)
+    # Need to create an array of the correct type, because ulab
+    # seems to get broadcasting of builtin Python types wrong.
+    offset = np.array([32768], dtype=np.uint16)
+
+    def read_mic() -> Any:
+        nonlocal samples
+        record(samples, count)
+        # Subtracting the offset in place wraps around, leaving signed 16-bit samples
+        # in signed, without making new arrays.
+        samples -= offset
+        return signed
+
+    return read_mic
+
+
+def clue_profile(*, period: int = 100, mic_samples: int = 256) -> BoardProfile:
+    """Services for the Adafruit CLUE, using ``adafruit_clue``.
+    Takes over the board NeoPixel from ``clue``.
+
+    :param int period: initial ``measurement_period`` for the sensors, in msecs.
+    :param int mic_samples: number of microphone samples sent each ``measurement_period``.
+    """
+    import board
+    from adafruit_clue import clue
+
+    clue._pixel.deinit()
+    return BoardProfile(
+        "CLUE",
+        # Arduino: 0x8071,  CircuitPython: 0x8072, app supports either
+        0x8072,
+        (
+            SensorSpec("AccelerometerService", "reading", lambda: clue.acceleration, period),
+            SensorSpec("BarometricPressureService", "reading", lambda: clue.pressure, period),
+            SensorSpec(
+                "ButtonService", "pressed", lambda: _pressed(False, clue.button_a, clue.button_b)
+            ),
+            SensorSpec("HumidityService", "reading", lambda: clue.humidity, period),
+            # Return "clear" color value from color sensor.
+            SensorSpec("LightSensorService", "reading", lambda: clue.color[3], period),
+            SensorSpec(
+                "MicrophoneService",
+                "set_sound_samples",
+                _mic_reader(clue._mic.record, mic_samples),
+                period,
+                settings={"number_of_channels": 1},
+            ),
+            SensorSpec("TemperatureService", "reading", lambda: clue.temperature, period),
+        ),
+        pixel_count=1,
+        show_pixels=_neopixel_writer(board.NEOPIXEL),
+        start_tone=clue.start_tone,
+        stop_tone=clue.stop_tone,
+    )
+
+
+def circuitplayground_bluefruit_profile(*, period: int = 100) -> BoardProfile:
+    """Services for the Adafruit Circuit Playground Bluefruit, using
+    ``adafruit_circuitplayground``. Takes over the NeoPixels from ``cp``.
+
+    :param int period: initial ``measurement_period`` for the sensors, in msecs.
+    """
+    import board
+    from adafruit_circuitplayground import cp
+
+    cp._pixels.deinit()
+    return BoardProfile(
+        "CPlay",
+        # Arduino: 0x8045,  CircuitPython: 0x8046, app supports either
+        0x8046,
+        (
+            SensorSpec("AccelerometerService", "reading", lambda: cp.acceleration, period),
+            SensorSpec(
+                "ButtonService", "pressed", lambda: _pressed(cp.switch, cp.button_a, cp.button_b)
+            ),
+            SensorSpec("LightSensorService", "reading", lambda: cp.light, period),
+            SensorSpec("TemperatureService", "reading", lambda: cp.temperature, period),
+        ),
+        pixel_count=10,
+        show_pixels=_neopixel_writer(board.NEOPIXEL),
+        start_tone=cp.start_tone,
+        stop_tone=cp.stop_tone,
+    )
+
+
+def feather_bluefruit_sense_profile(*, period: int = 100, mic_samples: int = 256) -> BoardProfile:
+    """Services for the Adafruit Feather Bluefruit Sense, using its on-board
+    LSM6DS33, BMP280, SHT31-D and APDS9960 sensors and PDM microphone.
+
+    :param int period: initial ``measurement_period`` for the sensors, in msecs.
+    :param int mic_samples: number of microphone samples sent each ``measurement_period``.
+    """
+    import adafruit_apds9960.apds9960
+    import adafruit_bmp280
+    import adafruit_lsm6ds.lsm6ds33
+    import adafruit_sht31d
+    import audiobusio
+    import board
+    import digitalio
+
+    i2c = board.I2C()
+    lsm6ds33 = adafruit_lsm6ds.lsm6ds33.LSM6DS33(i2c)
+    # Used for pressure and temperature.
+    bmp280 = adafruit_bmp280.Adafruit_BMP280_I2C(i2c)
+    sht31d = adafruit_sht31d.SHT31D(i2c)
+    # Used only for light sensor.
+    apds9960 = adafruit_apds9960.apds9960.APDS9960(i2c)
+    apds9960.enable_color = True
+    mic = audiobusio.PDMIn(
+        board.MICROPHONE_CLOCK,
+        board.MICROPHONE_DATA,
+        sample_rate=16000,
+        bit_depth=16,
+    )
+    button = digitalio.DigitalInOut(board.SWITCH)
+    button.pull = digitalio.Pull.UP
+
+    return BoardProfile(
+        "Sense",
+        # This board is not yet supported by the app.
+        # Arduino: 0x8087,  CircuitPython: 0x8088
+        0x8088,
+        (
+            SensorSpec("AccelerometerService", "reading", lambda: lsm6ds33.acceleration, period),
+            SensorSpec("BarometricPressureService", "reading", lambda: bmp280.pressure, period),
+            SensorSpec(
+                "ButtonService", "pressed", lambda: _pressed(False, not button.value, False)
+            ),
+            SensorSpec("HumidityService", "reading", lambda: sht31d.relative_humidity, period),
+            # Return "clear" color value from color sensor.
+            SensorSpec("LightSensorService", "reading", lambda: apds9960.color_data[3], period),
+            SensorSpec(
+                "MicrophoneService",
+                "set_sound_samples",
+                _mic_reader(mic.record, mic_samples),
+                period,
+                settings={"number_of_channels": 1},
+            ),
+            SensorSpec("TemperatureService", "reading", lambda: bmp280.temperature, period),
+        ),
+        pixel_count=1,
+        show_pixels=_neopixel_writer(board.NEOPIXEL),
+    )
@@ -0,0 +1,255 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.client_proxy`
+================================================================================
+
+For clients: proxies for remote services that keep the latest value sent by the
+server in notifications, so reading a value needs no round trip to the server.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import struct
+import time
+
+from adafruit_ble_adafruit import load_service
+from adafruit_ble_adafruit.compact_encoding import CompactEncoding
+from adafruit_ble_adafruit.notification_buffer import NotificationBuffer
+
+try:
+    from typing import Any, Optional, Tuple
+
+    from adafruit_ble import BLEConnection
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+
+class ServiceProxy:
+    """Turn on notifications for one characteristic of a remote service, and decode
+    each value as it arrives. Subclasses set `service_name`, `characteristic` and `format`.
+
+    `latest` returns the most recent value without asking the server for it.
+    Iterating, with ``for`` or ``async for``, returns every value, as
+    ``(timestamp, value)`` tuples, waiting for each one, until the connection closes.
+    Reading `latest` takes any values not yet returned by iteration, so use one or the other.
+
+    :param BLEConnection connection: the connection to the server.
+    :param int encoding: for services with a compact encoding, such as `TemperatureService`:
+      `CompactEncoding.INT16` or `CompactEncoding.INT24` asks the server to send values in
+      the ``compact`` characteristic, in fewer bytes. ``None`` leaves the encoding as it is.
+    :param int buffer_size: number of notifications queued before the oldest are dropped.
+    :param float poll_period: seconds to wait between checks while iterating.
+    """
+
+    service_name = None
+    """Registry name of the service class, such as ``"TemperatureService"``."""
+    characteristic = None
+    """Name of the characteristic to receive, such as ``"temperature"``."""
+    format = None
+    """`struct` format of the characteristic. A single value is returned unwrapped."""
+
+    def __init__(
+        self,
+        connection: BLEConnection,
+        *,
+        encoding: Optional[int] = None,
+        buffer_size: int = 8,
+        poll_period: float = 0.01,
+    ) -> None:
+        self._connection = connection
+        self.service = connection[load_service(self.service_name)]
+        """The remote service."""
+        self.poll_period = poll_period
+        self.timestamp = None
+        """When the latest value arrived, in msecs, from ``time.monotonic_ns()``,
+        or ``None`` if no value has arrived yet."""
+        self._latest = None
+        self._encoding = encoding
+        self._compact_encoder = None
+        name = self.characteristic
+        if encoding is not None and encoding != CompactEncoding.FLOAT32:
+            self.service.encoding = encoding
+            self._compact_encoder = self.service._compact_encoder()
+            name = "compact"
+        self._buffer = NotificationBuffer(self.service, name, buffer_size=buffer_size)
+
+    @classmethod
+    def decode_value(cls, data: ReadableBuffer) -> Any:
+        """Decode one value of `characteristic`. Needs no connection, so it can
+        also decode recorded values.
+        """
+        values = struct.unpack(cls.format, data)
+        return values[0] if len(values) == 1 else values
+
+    def decode(self, data: ReadableBuffer) -> Any:
+        """Decode one value received, in the compact encoding if one was asked for."""
+        if self._compact_encoder is not None:
+            return self._compact_encoder.decode(data, self._encoding)
+        return self.decode_value(data)
+
+    def _next(self) -> Optional[Tuple[int, Any]]:
+        data = self._buffer.read()
+        if data is None:
+            return None
+        self._latest = self.decode(data)
+        self.timestamp = time.monotonic_ns() // 1000000
+        return self.timestamp, self._latest
+
+    def update(self) -> int:
+        """Decode all the values that have arrived, keeping only the last.
+        Return how many there were.
+        """
+        count = 0
+        while self._next() is not None:
+            count += 1
+        return count
+
+    @property
+    def latest(self) -> Any:
+        """The most recent value, or ``None`` if no value has arrived yet."""
+        self.update()
+        return self._latest
+
+    def __iter__(self) -> "ServiceProxy":
+        return self
+
+    def __next__(self) -> Tuple[int, Any]:
+        while self._connection.connected:
+            update = self._next()
+            if update is not None:
+                return update
+            time.sleep(self.poll_period)
+        raise StopIteration
+
+    def __aiter__(self) -> "ServiceProxy":
+        return self
+
+    async def __anext__(self) -> Tuple[int, Any]:
+        import asyncio
+
+        while self._connection.connected:
+            update = self._next()
+            if update is not None:
+                return update
+            await asyncio.sleep(self.poll_period)
+        raise StopAsyncIteration
+
+    def deinit(self) -> None:
+        """Stop receiving notifications."""
+        self._buffer.deinit()
+
+
+class AccelerometerProxy(ServiceProxy):
+    """`AccelerometerService.acceleration`, as an (x, y, z) tuple in m/s^2."""
+
+    service_name = "AccelerometerService"
+    characteristic = "acceleration"
+    format = "<fff"
+
+
+class BarometricPressureProxy(ServiceProxy):
+    """`BarometricPressureService.pressure`, in hectopascals."""
+
+    service_name = "BarometricPressureService"
+    characteristic = "pressure"
+    format = "<f"
+
+
+class ButtonProxy(ServiceProxy):
+    """`ButtonService.pressed` bits."""
+
+    service_name = "ButtonService"
+    characteristic = "pressed"
+    format = "<I"
+
+
+class ColorSensorProxy(ServiceProxy):
+    """`ColorSensorService` (red, green, blue) values."""
+
+    service_name = "ColorSensorService"
+    # The characteristic is named acceleration in ColorSensorService.
+    characteristic = "acceleration"
+    format = "<HHH"
+
+
+class GestureProxy(ServiceProxy):
+    """`GestureService.gesture`."""
+
+    service_name = "GestureService"
+    characteristic = "gesture"
+    format = "<B"
+
+
+class GyroscopeProxy(ServiceProxy):
+    """`GyroscopeService.gyro`, as an (x, y, z) tuple in rad/s."""
+
+    service_name = "GyroscopeService"
+    characteristic = "gyro"
+    format = "<fff"
+
+
+class HumidityProxy(ServiceProxy):
+    """`HumidityService.humidity`, as a percentage."""
+
+    service_name = "HumidityService"
+    characteristic = "humidity"
+    format = "<f"
+
+
+class LightSensorProxy(ServiceProxy):
+    """`LightSensorService.light_level`."""
+
+    service_name = "LightSensorService"
+    characteristic = "light_level"
+    format = "<f"
+
+
+class MagnetometerProxy(ServiceProxy):
+    """`MagnetometerService.magnetic`, as an (x, y, z) tuple in microteslas."""
+
+    service_name = "MagnetometerService"
+    characteristic = "magnetic"
+    format = "<fff"
+
+
+class ProximityProxy(ServiceProxy):
+    """`ProximityService.proximity`."""
+
+    service_name = "ProximityService"
+    characteristic = "proximity"
+    format = "<H"
+
+
+class QuaternionProxy(ServiceProxy):
+    """`QuaternionService.quaternion`, as a (w, x, y, z) tuple."""
+
+    service_name = "QuaternionService"
+    characteristic = "quaternion"
+    format = "<ffff"
+
+
+class SensorFrameProxy(ServiceProxy):
+    """`SensorFrameService.frame`, as a `SensorFrame`."""
+
+    service_name = "SensorFrameService"
+    characteristic = "frame"
+
+    @classmethod
+    def decode_value(cls, data: ReadableBuffer) -> Any:
+        """Decode one frame."""
+        return load_service(cls.service_name).decode_frame(data)
+
+
+class TemperatureProxy(ServiceProxy):
+    """`TemperatureService.temperature`, in degrees Celsius."""
+
+    service_name = "TemperatureService"
+    characteristic = "temperature"
+    format = "<f"
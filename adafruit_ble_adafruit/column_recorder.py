@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.column_recorder`
+================================================================================
+
+For clients: compact storage for long recordings of sensor notifications,
+one preallocated array per value instead of one tuple per sample.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import struct
+from array import array
+
+try:
+    from typing import Dict, List, Sequence
+
+    from circuitpython_typing import ReadableBuffer
+
+    from adafruit_ble_adafruit.gateway import GatewayEvent
+except ImportError:
+    pass
+
+
+class ColumnRecorder:
+    """Record timestamped samples in columns: a timestamp column of doubles, and one
+    column of 32-bit floats for each value in a sample. For (x, y, z) samples this is
+    20 bytes a sample, instead of more than 100 bytes for a timestamp and a tuple of floats.
+
+    Columns grow in chunks of ``chunk_size`` samples, so a long recording never copies
+    what it already holds. Use `chunks()` to get the data without copying, for example
+    with ``numpy.frombuffer(view, dtype=numpy.float32)``, or `column()` to get one array.
+
+    :param str value_format: the `struct` format of a notification payload,
+      such as ``"<fff"`` for `AccelerometerService.acceleration`.
+    :param int chunk_size: number of samples per chunk.
+    """
+
+    def __init__(self, value_format: str = "<fff", *, chunk_size: int = 4096) -> None:
+        self.value_format = value_format
+        self.value_count = len(struct.unpack(value_format, bytes(struct.calcsize(value_format))))
+        self.chunk_size = chunk_size
+        # One list of arrays per column; column 0 is the timestamp.
+        self._chunks = [[] for _ in range(1 + self.value_count)]
+        # Samples in the last chunk.
+        self._fill = chunk_size
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _new_chunk(self) -> None:
+        zeros = bytes(4 * self.chunk_size)
+        self._chunks[0].append(array("d", bytes(8 * self.chunk_size)))
+        for chunks in self._chunks[1:]:
+            chunks.append(array("f", zeros))
+        self._fill = 0
+
+    def append(self, timestamp: float, values: Sequence[float]) -> None:
+        """Record one sample."""
+        if self._fill == self.chunk_size:
+            self._new_chunk()
+        fill = self._fill
+        columns = self._chunks
+        columns[0][-1][fill] = timestamp
+        for i in range(self.value_count):
+            columns[i + 1][-1][fill] = values[i]
+        self._fill = fill + 1
+        self._count += 1
+
+    def append_payload(self, timestamp: float, data: ReadableBuffer) -> None:
+        """Record one notification payload in `value_format`."""
+        self.append(timestamp, struct.unpack_from(self.value_format, data))
+
+    def chunks(self, index: int) -> List[memoryview]:
+        """Views of the filled part of each chunk of column ``index``: 0 for the timestamps,
+        1 for the first value, and so on. The views share memory with the recorder.
+        """
+        views = [memoryview(chunk) for chunk in self._chunks[index]]
+        if views:
+            views[-1] = views[-1][: self._fill]
+        return views
+
+    def column(self, index: int) -> array:
+        """A copy of column ``index`` as one array."""
+        result = array("d" if index == 0 else "f")
+        for view in self.chunks(index):
+            result.extend(view)
+        return result
+
+    def clear(self) -> None:
+        """Discard all the samples and free their memory."""
+        self._chunks = [[] for _ in range(1 + self.value_count)]
+        self._fill = self.chunk_size
+        self._count = 0
+
+
+class EventRecorder:
+    """Record the notifications in a stream of `GatewayEvent` tuples in one
+    `ColumnRecorder` per board and characteristic.
+
+    :param dict formats: the `struct` format for each characteristic name to record,
+      such as ``{"acceleration": "<fff", "gyro": "<fff"}``. Others are ignored.
+    :param int chunk_size: number of samples per chunk.
+    """
+
+    def __init__(self, formats: Dict[str, str], *, chunk_size: int = 4096) -> None:
+        self.formats = formats
+        self.chunk_size = chunk_size
+        self.recorders = {}
+        """`ColumnRecorder` by (address bytes, characteristic name)."""
+
+    def record(self, event: GatewayEvent) -> bool:
+        """Record ``event`` if it is a notification for one of the `formats`.
+        Return ``True`` if it was recorded.
+        """
+        value_format = self.formats.get(event.characteristic)
+        if value_format is None or event.data is None:
+            return False
+        key = (event.address.address_bytes, event.characteristic)
+        recorder = self.recorders.get(key)
+        if recorder is None:
+            recorder = ColumnRecorder(value_format, chunk_size=self.chunk_size)
+            self.recorders[key] = recorder
+        recorder.append_payload(event.timestamp, event.data)
+        return True
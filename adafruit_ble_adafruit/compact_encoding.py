@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.compact_encoding`
+================================================================================
+
+Scaled fixed-point encodings that send float sensor values in 2 or 3 bytes
+instead of 4.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import struct
+
+try:
+    from typing import Tuple, Union
+
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+
+class CompactEncoding:
+    """Encode and decode ``count`` float values as little-endian signed integers.
+    A value ``v`` is sent as ``round((v - offset) / scale)``, limited to the range
+    of the integer size, and decoded as ``n * scale + offset``.
+
+    :param float scale: the value of one integer step.
+    :param float offset: the value sent as 0.
+    :param int count: number of values: 1 for a single float, 3 for an (x, y, z) tuple.
+    """
+
+    FLOAT32 = 0
+    """32-bit floats: the service's regular characteristic is used, not ``compact``."""
+    INT16 = 1
+    """16-bit scaled integers."""
+    INT24 = 2
+    """24-bit scaled integers."""
+
+    _SIZES = (4, 2, 3)
+
+    def __init__(self, scale: float, offset: float = 0.0, count: int = 1) -> None:
+        self.scale = scale
+        self.offset = offset
+        self.count = count
+        self._buf = bytearray(3 * count)
+        self._view = memoryview(self._buf)
+
+    @classmethod
+    def size(cls, encoding: int) -> int:
+        """Number of bytes per value for ``encoding``."""
+        return cls._SIZES[encoding]
+
+    def encode(self, values: Union[float, Tuple[float, ...]], encoding: int) -> memoryview:
+        """Encode a float, or a tuple of ``count`` floats, as `INT16` or `INT24`.
+        The returned memoryview is reused by the next call.
+        """
+        if self.count == 1:
+            values = (values,)
+        buf = self._buf
+        scale = self.scale
+        offset = self.offset
+        if encoding == self.INT16:
+            for i in range(self.count):
+                n = round((values[i] - offset) / scale)
+                struct.pack_into("<h", buf, 2 * i, max(-0x8000, min(0x7FFF, n)))
+            return self._view[: 2 * self.count]
+        if encoding == self.INT24:
+            for i in range(self.count):
+                n = round((values[i] - offset) / scale)
+                n = max(-0x800000, min(0x7FFFFF, n))
+                buf[3 * i] = n & 0xFF
+                buf[3 * i + 1] = (n >> 8) & 0xFF
+                buf[3 * i + 2] = (n >> 16) & 0xFF
+            return self._view[: 3 * self.count]
+        raise ValueError("unknown encoding")
+
+    def decode(self, data: ReadableBuffer, encoding: int) -> Union[float, Tuple[float, ...]]:
+        """Decode `INT16` or `INT24` data into a float, or a tuple of ``count`` floats."""
+        scale = self.scale
+        offset = self.offset
+        if encoding == self.INT16:
+            values = tuple(n * scale + offset for n in struct.unpack(f"<{self.count}h", data))
+        elif encoding == self.INT24:
+            values = []
+            for i in range(0, 3 * self.count, 3):
+                n = data[i] | (data[i + 1] << 8) | (data[i + 2] << 16)
+                if n & 0x800000:
+                    n -= 0x1000000
+                values.append(n * scale + offset)
+            values = tuple(values)
+        else:
+            raise ValueError("unknown encoding")
+        return values[0] if self.count == 1 else values
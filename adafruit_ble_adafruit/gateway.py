@@ -0,0 +1,238 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.gateway`
+================================================================================
+
+A client that stays connected to many Adafruit boards at once, receives notifications
+from each, and merges them into one stream of timestamped events.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import time
+from collections import namedtuple
+
+from adafruit_ble_adafruit.notification_buffer import NotificationBuffer
+from adafruit_ble_adafruit.server_scanner import ServerScanner
+
+try:
+    from typing import Iterator, List, Optional, Sequence, Tuple, Type
+
+    import _bleio
+    from adafruit_ble import BLERadio
+
+    from adafruit_ble_adafruit.adafruit_service import AdafruitService
+except ImportError:
+    pass
+
+GatewayEvent = namedtuple(
+    "GatewayEvent", ("timestamp", "address", "kind", "service", "characteristic", "data")
+)
+"""One event from a board.
+
+* timestamp: when the gateway received it, in msecs, from ``time.monotonic_ns()``
+* address: the board's ``_bleio.Address``
+* kind: `Gateway.CONNECTED`, `Gateway.DISCONNECTED` or `Gateway.NOTIFICATION`
+* service: for notifications, the service class, such as `TemperatureService`
+* characteristic: for notifications, the characteristic name, such as ``"temperature"``
+* data: for notifications, the raw characteristic value, as ``bytes``
+"""
+
+
+def _monotonic_msecs() -> int:
+    return time.monotonic_ns() // 1000000
+
+
+class _Board:
+    """Connection state for one board."""
+
+    def __init__(self, address: _bleio.Address, pid: Optional[int]) -> None:
+        self.address = address
+        self.pid = pid
+        self.connection = None
+        # (service class, characteristic name, NotificationBuffer)
+        self.subscriptions = []
+        self.failures = 0
+        # When to try to connect next, in msecs.
+        self.retry_at = 0
+
+
+class Gateway:
+    """Keep connections to many boards, and turn their notifications into `GatewayEvent`
+    tuples. Boards are found with a `ServerScanner`, or added with `add()`. A board that
+    cannot be connected, or that disconnects, is retried with exponential backoff.
+
+    Connecting is blocking, so boards are connected one at a time, within `poll()`.
+
+    :param BLERadio ble: the radio.
+    :param characteristics: the notifications wanted from each board, as
+      (service class, characteristic name) pairs, such as
+      ``((TemperatureService, "temperature"), (AccelerometerService, "acceleration"))``.
+      Services a board does not have are skipped.
+    :param pids: if given, only boards advertising one of these PIDs are added by `discover()`.
+    :param int max_boards: the most boards to keep track of.
+    :param int buffer_size: notifications queued per characteristic between polls.
+    :param float connect_timeout: seconds to wait for each connection.
+    :param float min_backoff: seconds before the first retry.
+    :param float max_backoff: the longest wait between retries, in seconds.
+    """
+
+    CONNECTED = 0
+    """Event kind: the board has been connected and subscribed to."""
+    DISCONNECTED = 1
+    """Event kind: the board has disconnected, or could not be subscribed to."""
+    NOTIFICATION = 2
+    """Event kind: a characteristic value arrived."""
+
+    def __init__(
+        self,
+        ble: BLERadio,
+        characteristics: Sequence[Tuple[Type[AdafruitService], str]],
+        *,
+        pids: Optional[Sequence[int]] = None,
+        max_boards: int = 64,
+        buffer_size: int = 8,
+        connect_timeout: float = 4.0,
+        min_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ) -> None:
+        self._ble = ble
+        self._characteristics = characteristics
+        self._pids = pids
+        self.max_boards = max_boards
+        self.buffer_size = buffer_size
+        self.connect_timeout = connect_timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self._scanner = ServerScanner(ble)
+        # _Board, by address bytes.
+        self._boards = {}
+
+    @property
+    def addresses(self) -> List[_bleio.Address]:
+        """The addresses of all the boards being tracked."""
+        return [board.address for board in self._boards.values()]
+
+    @property
+    def connected_count(self) -> int:
+        """The number of boards currently connected."""
+        return sum(1 for board in self._boards.values() if board.connection is not None)
+
+    def add(self, address: _bleio.Address, pid: Optional[int] = None) -> bool:
+        """Start tracking the board at ``address``. It is connected on the next `poll()`.
+        Return ``False`` if it is already tracked or `max_boards` are already tracked.
+        """
+        key = address.address_bytes
+        if key in self._boards or len(self._boards) >= self.max_boards:
+            return False
+        self._boards[key] = _Board(address, pid)
+        return True
+
+    def discover(self, timeout: float = 1.0) -> int:
+        """Scan for ``timeout`` seconds and `add()` the boards heard.
+        Return the number of boards added.
+        """
+        pids = self._pids
+        added = 0
+        for record in self._scanner.scan(timeout=timeout):
+            if pids is not None and record.pid not in pids:
+                continue
+            if self.add(record.address, record.pid):
+                added += 1
+        self._ble.stop_scan()
+        return added
+
+    def _backoff(self, board: _Board, now: int) -> None:
+        delay = min(self.max_backoff, self.min_backoff * (2**board.failures))
+        board.failures += 1
+        board.retry_at = now + int(delay * 1000)
+
+    def _drop(self, board: _Board, now: int, events: List[GatewayEvent]) -> None:
+        for _, _, buffer in board.subscriptions:
+            buffer.deinit()
+        board.subscriptions = []
+        connection = board.connection
+        board.connection = None
+        if connection is not None and connection.connected:
+            connection.disconnect()
+        events.append(GatewayEvent(now, board.address, self.DISCONNECTED, None, None, None))
+
+    def _connect(self, board: _Board, now: int, events: List[GatewayEvent]) -> None:
+        try:
+            connection = self._ble.connect(board.address, timeout=self.connect_timeout)
+        except Exception:  # Errors differ between _bleio implementations.
+            self._backoff(board, now)
+            return
+        board.connection = connection
+        try:
+            for service_class, name in self._characteristics:
+                if service_class not in connection:
+                    continue
+                buffer = NotificationBuffer(
+                    connection[service_class], name, buffer_size=self.buffer_size
+                )
+                board.subscriptions.append((service_class, name, buffer))
+        except Exception:
+            self._drop(board, now, events)
+            self._backoff(board, now)
+            return
+        board.failures = 0
+        events.append(GatewayEvent(now, board.address, self.CONNECTED, None, None, None))
+
+    def poll(self) -> List[GatewayEvent]:
+        """Connect boards that are due for a connection attempt, notice disconnections,
+        and collect queued notifications. Return the events, oldest first.
+        """
+        events = []
+        for board in self._boards.values():
+            now = _monotonic_msecs()
+            connection = board.connection
+            if connection is None:
+                if now >= board.retry_at:
+                    self._connect(board, now, events)
+                continue
+            if not connection.connected:
+                self._drop(board, now, events)
+                self._backoff(board, now)
+                continue
+            for service_class, name, buffer in board.subscriptions:
+                while True:
+                    data = buffer.read()
+                    if data is None:
+                        break
+                    events.append(
+                        GatewayEvent(
+                            now, board.address, self.NOTIFICATION, service_class, name, bytes(data)
+                        )
+                    )
+        return events
+
+    def events(
+        self, *, poll_period: float = 0.01, discover_period: Optional[float] = 30.0
+    ) -> Iterator[GatewayEvent]:
+        """Yield events forever. Scan for new boards every ``discover_period`` seconds,
+        or never if it is ``None``, and poll every ``poll_period`` seconds.
+        """
+        next_discover = 0
+        while True:
+            now = _monotonic_msecs()
+            if discover_period is not None and now >= next_discover:
+                self.discover()
+                next_discover = now + int(discover_period * 1000)
+            yield from self.poll()
+            time.sleep(poll_period)
+
+    def disconnect(self) -> None:
+        """Disconnect all the boards, and stop tracking them."""
+        events = []
+        now = _monotonic_msecs()
+        for board in self._boards.values():
+            if board.connection is not None:
+                self._drop(board, now, events)
+        self._boards = {}
@@ -20,9 +20,10 @@ from adafruit_ble.characteristics import Characteristic
 from adafruit_ble.characteristics.float import FloatCharacteristic
 
 from adafruit_ble_adafruit.adafruit_service import AdafruitService
+from adafruit_ble_adafruit.sensor_reading import SensorReadingMixin
 
 
-class HumidityService(AdafruitService):
+class HumidityService(SensorReadingMixin, AdafruitService):
     """Humidity sensor value."""
 
     uuid = AdafruitService.adafruit_service_uuid(0x700)
@@ -34,3 +35,12 @@ class HumidityService(AdafruitService):
     """Relative humidity as a percentage, 0.0% - 100.0% (float)"""
     measurement_period = AdafruitService.measurement_period_charac()
     """Initially 1000ms."""
+
+    _reading_name = "humidity"
+    _reading_count = 1
+    encoding = SensorReadingMixin.encoding_charac()
+    """`CompactEncoding` used by `reading`. Initially 0: floats in ``humidity``."""
+    encoding_scale = SensorReadingMixin.encoding_scale_charac(0.01)
+    """(scale, offset) of the compact encoding: one step is 0.01%."""
+    compact = SensorReadingMixin.compact_charac()
+    """``humidity`` in the compact `encoding`, when the client has chosen one."""
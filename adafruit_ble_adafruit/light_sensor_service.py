@@ -19,9 +19,10 @@ from adafruit_ble.characteristics import Characteristic
 from adafruit_ble.characteristics.float import FloatCharacteristic
 
 from adafruit_ble_adafruit.adafruit_service import AdafruitService
+from adafruit_ble_adafruit.sensor_reading import SensorReadingMixin
 
 
-class LightSensorService(AdafruitService):
+class LightSensorService(SensorReadingMixin, AdafruitService):
     """Light sensor value."""
 
     uuid = AdafruitService.adafruit_service_uuid(0x300)
@@ -33,3 +34,13 @@ class LightSensorService(AdafruitService):
     """Uncalibrated light level (float)"""
     measurement_period = AdafruitService.measurement_period_charac()
     """Initially 1000ms."""
+
+    _reading_name = "light_level"
+    _reading_count = 1
+    encoding = SensorReadingMixin.encoding_charac()
+    """`CompactEncoding` used by `reading`. Initially 0: floats in ``light_level``."""
+    encoding_scale = SensorReadingMixin.encoding_scale_charac(1.0, 32768.0)
+    """(scale, offset) of the compact encoding: one step is 1.0. The offset centers
+    ``INT16`` on the 0 to 65535 range of the light level."""
+    compact = SensorReadingMixin.compact_charac()
+    """``light_level`` in the compact `encoding`, when the client has chosen one."""
@@ -0,0 +1,358 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.loopback`
+================================================================================
+
+An in-process stand-in for a BLE connection, so services can be exercised and timed
+without radios: a server half and a client half of the same services, connected
+by one queue in each direction.
+
+.. code-block:: python
+
+    link = LoopbackLink(mtu=247, connection_interval=0.0075)
+    server = link.serve(TemperatureService)
+    client = TemperatureProxy(link.connection)
+    server.temperature = 21.5
+    link.deliver()
+    print(client.latest, link.clock)
+
+Both halves are ordinary service instances, bound to loopback characteristics in place
+of ``_bleio`` ones, so `AdafruitService` subclasses and their packet characteristics,
+such as those of `ToneService` and `AddressablePixelService`, work unchanged.
+
+Time on the link is simulated. Writes and notifications wait in the queues until
+`LoopbackLink.step()` runs a connection event, which advances `LoopbackLink.clock` by
+the connection interval and carries up to ``packets_per_event`` packets each way.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import random
+import time
+
+from adafruit_ble.characteristics import Characteristic, ComplexCharacteristic
+
+try:
+    from typing import Any, Callable, List, Optional, Type
+
+    from circuitpython_typing import ReadableBuffer
+
+    from adafruit_ble_adafruit.adafruit_service import AdafruitService
+except ImportError:
+    pass
+
+# ATT header bytes in each packet: opcode and handle.
+_ATT_HEADER = 3
+
+
+class _Attribute:
+    """The state of one characteristic, shared by the server and client halves."""
+
+    def __init__(self, descriptor: Any) -> None:
+        self.uuid = descriptor.uuid.bleio_uuid
+        self.properties = descriptor.properties
+        self.max_length = descriptor.max_length
+        # The same default as a locally bound characteristic.
+        value = descriptor.initial_value
+        if value is None:
+            value = bytes(self.max_length or 0)
+        self.value = bytes(value)
+        self.subscribed = False
+        self.server = None
+        self.client = None
+
+
+class LoopbackCharacteristic:
+    """One half of a characteristic on a `LoopbackLink`. Has the parts of
+    ``_bleio.Characteristic`` that services and ``_bleio.PacketBuffer`` use.
+    """
+
+    def __init__(self, link: "LoopbackLink", attribute: _Attribute, server: bool) -> None:
+        self._link = link
+        self._attribute = attribute
+        self._server = server
+        self._notify_callbacks = []
+        self.uuid = attribute.uuid
+        self.properties = attribute.properties
+        self.max_length = attribute.max_length
+
+    @property
+    def value(self) -> bytes:
+        """The value of this characteristic. Reading it from the client side
+        first delivers everything queued, and costs a connection event.
+        """
+        if not self._server:
+            self._link._read()
+        return self._attribute.value
+
+    @value.setter
+    def value(self, value: ReadableBuffer) -> None:
+        attribute = self._attribute
+        if self._server:
+            attribute.value = bytes(value)
+            if attribute.subscribed and attribute.properties & Characteristic.NOTIFY:
+                self._link._send(attribute.client, value, reliable=False)
+        else:
+            self._link._send(
+                attribute.server,
+                value,
+                reliable=bool(attribute.properties & Characteristic.WRITE),
+            )
+
+    def set_cccd(self, *, notify: bool = False, indicate: bool = False) -> None:
+        """Turn notifications from the server on or off."""
+        self._attribute.subscribed = notify or indicate
+
+    def _add_notify_callback(self, callback: Callable[[bytes], None]) -> None:
+        self._notify_callbacks.append(callback)
+
+    def _remove_notify_callback(self, callback: Callable[[bytes], None]) -> None:
+        if callback in self._notify_callbacks:
+            self._notify_callbacks.remove(callback)
+
+    # The name Blinka's PacketBuffer.deinit() uses.
+    remove_notify_callback = _remove_notify_callback
+
+    def _receive(self, data: bytes) -> None:
+        if self._server:
+            self._attribute.value = data
+        for callback in tuple(self._notify_callbacks):
+            callback(data)
+
+
+class LoopbackService:
+    """One half of a service on a `LoopbackLink`. Has the parts of ``_bleio.Service``
+    that services use. It is always ``remote``, so that `adafruit_ble` binds characteristics
+    to the loopback ones instead of adding ``_bleio`` characteristics of its own.
+    """
+
+    remote = True
+    secondary = False
+
+    def __init__(self, uuid: Any, characteristics: List[LoopbackCharacteristic]) -> None:
+        self.uuid = uuid
+        self.characteristics = tuple(characteristics)
+
+
+class LoopbackConnection:
+    """The client half of a `LoopbackLink`. Has the parts of ``BLEConnection`` that clients
+    use, so it can be passed to a `ServiceProxy`, for example.
+    """
+
+    def __init__(self, link: "LoopbackLink") -> None:
+        self._link = link
+        self._services = {}
+
+    @property
+    def connected(self) -> bool:
+        """``True`` until `disconnect()`."""
+        return self._link.connected
+
+    def __contains__(self, service_class: Type[AdafruitService]) -> bool:
+        return service_class in self._link._attributes
+
+    def __getitem__(self, service_class: Type[AdafruitService]) -> AdafruitService:
+        service = self._services.get(service_class)
+        if service is None:
+            service = service_class(service=self._link._bind(service_class, False))
+            self._services[service_class] = service
+        return service
+
+    def disconnect(self) -> None:
+        """Disconnect. Queued packets are discarded."""
+        self._link.disconnect()
+
+
+class LoopbackLink:
+    """A simulated connection between a server and a client.
+
+    Values longer than will fit in one packet are truncated when sent as notifications
+    or writes without response, as BLE stacks do. Writes with response are split into
+    as many packets as needed. Notifications and writes without response are lost with
+    probability ``loss``; writes with response are acknowledged, so they are never lost.
+
+    :param int mtu: the ATT MTU. Each packet carries up to ``mtu - 3`` bytes of value.
+    :param float connection_interval: seconds between connection events.
+    :param int packets_per_event: packets carried each way in one connection event.
+    :param float loss: the chance, from 0.0 to 1.0, that an unacknowledged packet is lost.
+    :param int seed: seed for choosing the lost packets, to repeat a run exactly.
+    :param bool realtime: if ``True``, `step()` sleeps for the connection interval,
+      so the link runs no faster than a real one would.
+    """
+
+    def __init__(
+        self,
+        *,
+        mtu: int = 23,
+        connection_interval: float = 0.0075,
+        packets_per_event: int = 4,
+        loss: float = 0.0,
+        seed: Optional[int] = None,
+        realtime: bool = False,
+    ) -> None:
+        if mtu <= _ATT_HEADER:
+            raise ValueError("mtu must be more than 3")
+        self.mtu = mtu
+        self.connection_interval = connection_interval
+        self.packets_per_event = packets_per_event
+        self.loss = loss
+        self.realtime = realtime
+        self._random = random.Random(seed)
+        self.connected = True
+        """``False`` after `disconnect()`."""
+        self.clock = 0.0
+        """Simulated seconds since the link was made."""
+        self.packets_sent = 0
+        """Packets queued, counting each packet of a split write."""
+        self.packets_lost = 0
+        """Packets dropped, instead of queued, to simulate loss."""
+        self.values_delivered = 0
+        """Values that have arrived at the other half."""
+        self.bytes_delivered = 0
+        """Bytes of value that have arrived at the other half."""
+        self.total_latency = 0.0
+        """Total simulated seconds the delivered values spent queued."""
+        # _Attribute by characteristic name, by served service class.
+        self._attributes = {}
+        # Queued [sent clock, destination, data, packets still to carry], oldest first.
+        self._to_server = []
+        self._to_client = []
+        self.connection = LoopbackConnection(self)
+        """The client half."""
+
+    @property
+    def payload_size(self) -> int:
+        """Bytes of value that fit in one packet."""
+        return self.mtu - _ATT_HEADER
+
+    @property
+    def pending(self) -> int:
+        """Number of values waiting in the queues."""
+        return len(self._to_server) + len(self._to_client)
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean simulated seconds from sending a value to its delivery."""
+        if not self.values_delivered:
+            return 0.0
+        return self.total_latency / self.values_delivered
+
+    @property
+    def throughput(self) -> float:
+        """Bytes of value delivered per simulated second."""
+        if not self.clock:
+            return 0.0
+        return self.bytes_delivered / self.clock
+
+    def serve(self, service_class: Type[AdafruitService], **kwargs: Any) -> AdafruitService:
+        """Make the server half of a service, which the client half can then
+        get from `connection`, as ``link.connection[service_class]``.
+
+        :param service_class: the service, such as `TemperatureService`.
+        :param kwargs: other arguments to the service, such as ``packet_queue_depth``.
+        """
+        attributes = {}
+        for name in dir(service_class):
+            if name.startswith("__"):
+                continue
+            descriptor = getattr(service_class, name)
+            if isinstance(descriptor, (Characteristic, ComplexCharacteristic)):
+                attributes[name] = _Attribute(descriptor)
+        self._attributes[service_class] = attributes
+        service = service_class(service=self._bind(service_class, True), **kwargs)
+        # Bind every characteristic now, as for a local service, so that packet
+        # characteristics have their PacketBuffers before the client writes.
+        for name in attributes:
+            getattr(service, name)
+        return service
+
+    def _bind(self, service_class: Type[AdafruitService], server: bool) -> LoopbackService:
+        attributes = self._attributes.get(service_class)
+        if attributes is None:
+            raise KeyError(f"{service_class.__name__} is not served")
+        characteristics = []
+        for attribute in attributes.values():
+            characteristic = LoopbackCharacteristic(self, attribute, server)
+            if server:
+                attribute.server = characteristic
+            else:
+                attribute.client = characteristic
+            characteristics.append(characteristic)
+        return LoopbackService(service_class.uuid.bleio_uuid, characteristics)
+
+    def _send(
+        self, destination: LoopbackCharacteristic, value: ReadableBuffer, reliable: bool
+    ) -> None:
+        if not self.connected:
+            raise ConnectionError("Connection has been disconnected")
+        if destination is None:
+            # No client half yet, so nothing to notify.
+            return
+        payload_size = self.payload_size
+        data = bytes(value)
+        if reliable:
+            packets = max(1, (len(data) + payload_size - 1) // payload_size)
+        else:
+            data = data[:payload_size]
+            packets = 1
+            if self.loss and self._random.random() < self.loss:
+                self.packets_lost += 1
+                return
+        self.packets_sent += packets
+        queue = self._to_server if destination._server else self._to_client
+        queue.append([self.clock, destination, data, packets])
+
+    def _carry(self, queue: List[List]) -> None:
+        budget = self.packets_per_event
+        while queue and budget:
+            entry = queue[0]
+            packets = min(budget, entry[3])
+            entry[3] -= packets
+            budget -= packets
+            if entry[3]:
+                break
+            queue.pop(0)
+            sent, destination, data, _ = entry
+            self.values_delivered += 1
+            self.bytes_delivered += len(data)
+            self.total_latency += self.clock - sent
+            destination._receive(data)
+
+    def step(self) -> None:
+        """Run one connection event: advance `clock` by the connection interval,
+        and carry up to ``packets_per_event`` packets each way.
+        """
+        if self.realtime:
+            time.sleep(self.connection_interval)
+        self.clock += self.connection_interval
+        self._carry(self._to_server)
+        self._carry(self._to_client)
+
+    def deliver(self) -> int:
+        """Run connection events until the queues are empty.
+        Return the number of connection events.
+        """
+        events = 0
+        while self._to_server or self._to_client:
+            self.step()
+            events += 1
+        return events
+
+    def _read(self) -> None:
+        if not self.connected:
+            raise ConnectionError("Connection has been disconnected")
+        # A read waits behind what is already queued, then takes one more event.
+        self.deliver()
+        self.step()
+
+    def disconnect(self) -> None:
+        """Disconnect. Queued packets are discarded."""
+        self.connected = False
+        self._to_server = []
+        self._to_client = []
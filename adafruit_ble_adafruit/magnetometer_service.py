@@ -18,9 +18,10 @@ from adafruit_ble.attributes import Attribute
 from adafruit_ble.characteristics import Characteristic, StructCharacteristic
 
 from adafruit_ble_adafruit.adafruit_service import AdafruitService
+from adafruit_ble_adafruit.sensor_reading import SensorReadingMixin
 
 
-class MagnetometerService(AdafruitService):
+class MagnetometerService(SensorReadingMixin, AdafruitService):
     """Magnetometer values."""
 
     uuid = AdafruitService.adafruit_service_uuid(0x500)
@@ -33,3 +34,12 @@ class MagnetometerService(AdafruitService):
     """Tuple (x, y, z) float magnetometer values, in micro-Teslas (uT)"""
     measurement_period = AdafruitService.measurement_period_charac()
     """Initially 1000ms."""
+
+    _reading_name = "magnetic"
+    _reading_count = 3
+    encoding = SensorReadingMixin.encoding_charac()
+    """`CompactEncoding` used by `reading`. Initially 0: floats in ``magnetic``."""
+    encoding_scale = SensorReadingMixin.encoding_scale_charac(0.1)
+    """(scale, offset) of the compact encoding: one step is 0.1 microteslas."""
+    compact = SensorReadingMixin.compact_charac(3)
+    """``magnetic`` in the compact `encoding`, when the client has chosen one."""
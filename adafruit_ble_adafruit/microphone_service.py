@@ -14,12 +14,130 @@ BLE access to microphone data.
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
 
+import math
+import struct
+from array import array
+from collections import namedtuple
+
 from adafruit_ble.attributes import Attribute
 from adafruit_ble.characteristics import Characteristic
-from adafruit_ble.characteristics.int import Uint8Characteristic
+from adafruit_ble.characteristics.int import Uint8Characteristic, Uint16Characteristic
 
+from adafruit_ble_adafruit import audio_codec
 from adafruit_ble_adafruit.adafruit_service import AdafruitService
 
+try:
+    from ulab import numpy as np
+except ImportError:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+try:
+    from typing import Optional, Sequence, Tuple
+
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+_STREAM_HEADER_FORMAT = "<I"
+_STREAM_HEADER_SIZE = struct.calcsize(_STREAM_HEADER_FORMAT)
+
+NUM_BANDS = 8
+"""Number of frequency bands in `SoundFeatures.bands`."""
+
+_FEATURES_FORMAT = f"<fHf{NUM_BANDS}f"
+
+SoundFeatures = namedtuple("SoundFeatures", ("rms", "peak", "zero_crossing_rate", "bands"))
+"""Namedtuple of features computed from one window of sound samples.
+
+* rms
+
+    root-mean-square sample value
+
+* peak
+
+    largest absolute sample value
+
+* zero_crossing_rate
+
+    fraction of adjacent sample pairs that change sign, counting 0 as positive
+
+* bands
+
+    tuple of `NUM_BANDS` energies in equal-width frequency bands from 0 up to
+    half the sample rate, lowest first
+"""
+
+
+def _fft_band_energies(x: "np.ndarray", num_bands: int) -> Tuple[float, ...]:
+    # ulab and numpy FFTs want a power-of-two length.
+    n = 1
+    while n * 2 <= len(x):
+        n *= 2
+    spectrum = np.fft.fft(x[:n])
+    if isinstance(spectrum, tuple):
+        # Older ulab returns (real, imaginary).
+        real, imag = spectrum
+        power = real * real + imag * imag
+    else:
+        power = abs(spectrum) ** 2
+    bins_per_band = max(1, (n // 2) // num_bands)
+    return tuple(
+        float(np.sum(power[band * bins_per_band : (band + 1) * bins_per_band])) / n
+        for band in range(num_bands)
+    )
+
+
+def _goertzel_band_energies(samples: Sequence[int], num_bands: int) -> Tuple[float, ...]:
+    # No FFT available: find the power in each FFT bin with the Goertzel algorithm,
+    # and sum it over the bins in each band, just as _fft_band_energies() does.
+    n = 1
+    while n * 2 <= len(samples):
+        n *= 2
+    bins_per_band = max(1, (n // 2) // num_bands)
+    energies = []
+    for band in range(num_bands):
+        energy = 0.0
+        for k in range(band * bins_per_band, (band + 1) * bins_per_band):
+            coefficient = 2 * math.cos(2 * math.pi * k / n)
+            previous = previous2 = 0.0
+            for i in range(n):
+                previous, previous2 = samples[i] + coefficient * previous - previous2, previous
+            energy += (
+                previous * previous + previous2 * previous2 - coefficient * previous * previous2
+            )
+        energies.append(energy / n)
+    return tuple(energies)
+
+
+def compute_sound_features(samples: Sequence[int], num_bands: int = NUM_BANDS) -> SoundFeatures:
+    """Compute `SoundFeatures` for one window of signed sound samples.
+    Uses ``ulab`` or ``numpy`` when available; otherwise falls back to plain Python,
+    which is much slower but gives the same features.
+    """
+    if np is not None:
+        # ulab calls its float type np.float; numpy no longer has np.float.
+        x = np.array(samples, dtype=getattr(np, "float", float))
+        if len(x) == 0:
+            return SoundFeatures(0.0, 0, 0.0, (0.0,) * num_bands)
+        rms = math.sqrt(float(np.sum(x * x)) / len(x))
+        peak = int(np.max(abs(x)))
+        # Zero counts as non-negative, so a sign change through a 0 sample is counted.
+        crossings = int(np.sum((x[1:] < 0) != (x[:-1] < 0)))
+        bands = _fft_band_energies(x, num_bands)
+    else:
+        if not samples:
+            return SoundFeatures(0.0, 0, 0.0, (0.0,) * num_bands)
+        rms = math.sqrt(sum(sample * sample for sample in samples) / len(samples))
+        peak = max(abs(sample) for sample in samples)
+        crossings = sum(
+            1 for i in range(1, len(samples)) if (samples[i] < 0) != (samples[i - 1] < 0)
+        )
+        bands = _goertzel_band_energies(samples, num_bands)
+    return SoundFeatures(rms, min(peak, 0xFFFF), crossings / max(1, len(samples) - 1), bands)
+
 
 class MicrophoneService(AdafruitService):
     """Digital microphone data."""
@@ -46,3 +164,243 @@ class MicrophoneService(AdafruitService):
 
     measurement_period = AdafruitService.measurement_period_charac()
     """Initially 1000ms."""
+
+    STREAM_MAX_LENGTH = 244
+    """Largest `sound_stream` packet: a 247-byte ATT MTU less the 3-byte notification header."""
+
+    sound_stream = Characteristic(
+        uuid=AdafruitService.adafruit_service_uuid(0xB03),
+        properties=(Characteristic.READ | Characteristic.NOTIFY),
+        write_perm=Attribute.NO_ACCESS,
+        max_length=STREAM_MAX_LENGTH,
+    )
+    """
+    Continuous stream of 16-bit sound samples, sent by `MicrophoneStreamer`.
+    Each packet is the uint32 index of its first sample since streaming started,
+    followed by the samples. A client can detect lost samples from gaps in the indices;
+    see `MicrophoneStreamReassembler`.
+    """
+
+    stream_packet_size = Uint16Characteristic(
+        uuid=AdafruitService.adafruit_service_uuid(0xB04),
+        properties=(Characteristic.READ | Characteristic.WRITE),
+        initial_value=20,
+        max_value=STREAM_MAX_LENGTH,
+    )
+    """
+    Size in bytes of each `sound_stream` packet. The client sets this to its
+    negotiated ATT MTU less 3. Initially 20, which fits the minimum MTU.
+    """
+
+    sound_features = Characteristic(
+        uuid=AdafruitService.adafruit_service_uuid(0xB05),
+        properties=(Characteristic.READ | Characteristic.NOTIFY),
+        write_perm=Attribute.NO_ACCESS,
+        max_length=struct.calcsize(_FEATURES_FORMAT),
+        # Empty, not zero-filled, until features are sent, so that
+        # sound_features_values can tell no features from silence.
+        initial_value=b"",
+    )
+    """
+    Features of one window of sound, instead of the samples themselves:
+    rms: float, peak: uint16, zero-crossing rate: float, then `NUM_BANDS` band energies:
+    floats. See `SoundFeatures`. The window is one ``measurement_period`` of samples.
+    """
+
+    def window_size(self, sample_rate: int) -> int:
+        """Number of samples per ``measurement_period`` at ``sample_rate``,
+        for collecting the window passed to `set_sound_features()`.
+        """
+        return max(0, sample_rate * self.cached_measurement_period // 1000)
+
+    def set_sound_features(self, samples: Sequence[int]) -> SoundFeatures:
+        """Compute features for a window of signed samples and send them in `sound_features`.
+        Return the features.
+        """
+        features = compute_sound_features(samples)
+        self.sound_features = struct.pack(
+            _FEATURES_FORMAT,
+            features.rms,
+            features.peak,
+            features.zero_crossing_rate,
+            *features.bands,
+        )
+        return features
+
+    @property
+    def sound_features_values(self) -> Optional[SoundFeatures]:
+        """For clients: the latest `sound_features` as `SoundFeatures`,
+        or ``None`` if none have been sent yet.
+        """
+        data = self.sound_features
+        if len(data) < struct.calcsize(_FEATURES_FORMAT):
+            return None
+        values = struct.unpack(_FEATURES_FORMAT, data)
+        return SoundFeatures(values[0], values[1], values[2], values[3:])
+
+    sound_codec = Uint8Characteristic(
+        uuid=AdafruitService.adafruit_service_uuid(0xB06),
+        properties=(Characteristic.READ | Characteristic.WRITE),
+        initial_value=audio_codec.PCM16,
+        max_value=audio_codec.IMA_ADPCM,
+    )
+    """
+    Encoding of the samples in `sound_samples` and `sound_stream`, set by the client:
+    0 = 16-bit PCM (`audio_codec.PCM16`), 1 = 8-bit µ-law (`audio_codec.MULAW`),
+    2 = 4-bit IMA-ADPCM (`audio_codec.IMA_ADPCM`). Initially 0.
+    """
+
+    def set_sound_samples(self, samples: Sequence[int]) -> None:
+        """Send signed 16-bit ``samples`` in `sound_samples`, encoded with the
+        client's chosen `sound_codec`. Up to 512 bytes of encoded samples are sent.
+        """
+        codec = self.sound_codec
+        count = min(len(samples), audio_codec.samples_in(512, codec))
+        if codec == audio_codec.PCM16:
+            # Sample buffers are already PCM16: send their bytes as they are.
+            self.sound_samples = samples[:count]
+            return
+        self.sound_samples = audio_codec.encode(samples[:count], codec)
+
+    @property
+    def sound_samples_values(self) -> array:
+        """For clients: `sound_samples` decoded with the current `sound_codec`,
+        as an ``array("h")``.
+        """
+        return audio_codec.decode(self.sound_samples, self.sound_codec)
+
+
+class MicrophoneStreamer:
+    """Buffer microphone samples on the server and send them on
+    `MicrophoneService.sound_stream` without gaps between measurement periods.
+
+    :param MicrophoneService service: the local service.
+    :param int capacity: number of samples the ring buffer holds. If samples arrive
+      faster than they can be sent, the oldest are dropped and counted in `overruns`.
+    """
+
+    def __init__(self, service: MicrophoneService, capacity: int = 2048) -> None:
+        self._service = service
+        self._ring = array("h", [0] * capacity)
+        self._capacity = capacity
+        self._start = 0
+        self._count = 0
+        # Index, since streaming started, of the sample at self._start.
+        self._index = 0
+        self._packet = bytearray(MicrophoneService.STREAM_MAX_LENGTH)
+        self._packet_view = memoryview(self._packet)
+        # Carries IMA-ADPCM predictor state from one packet to the next.
+        self._adpcm_state = audio_codec.AdpcmState()
+        # Number of samples dropped because the ring buffer was full.
+        self.overruns = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def write(self, samples: array) -> None:
+        """Append ``samples``, an ``array("h")`` of signed 16-bit samples."""
+        ring = self._ring
+        capacity = self._capacity
+        total = len(samples)
+        if total > capacity:
+            # Only the newest samples fit.
+            skipped = total - capacity
+            self._drop(self._count)
+            self.overruns += skipped
+            self._index += skipped
+            samples = samples[skipped:]
+            total = capacity
+        overflow = self._count + total - capacity
+        if overflow > 0:
+            self._drop(overflow)
+        position = (self._start + self._count) % capacity
+        first = min(total, capacity - position)
+        ring[position : position + first] = samples[:first]
+        if first < total:
+            ring[0 : total - first] = samples[first:total]
+        self._count += total
+
+    def _drop(self, count: int) -> None:
+        self._start = (self._start + count) % self._capacity
+        self._count -= count
+        self._index += count
+        self.overruns += count
+
+    def send(self) -> int:
+        """Send all buffered samples that fill whole `sound_stream` packets.
+        Return the number of packets sent.
+        """
+        service = self._service
+        # Read the packet size and codec once per call, not once per packet.
+        packet_size = min(service.stream_packet_size, MicrophoneService.STREAM_MAX_LENGTH)
+        codec = service.sound_codec
+        per_packet = audio_codec.samples_in(packet_size - _STREAM_HEADER_SIZE, codec)
+        if per_packet <= 0:
+            return 0
+        packet = self._packet
+        ring = self._ring
+        ring_view = memoryview(ring)
+        capacity = self._capacity
+        sent = 0
+        while self._count >= per_packet:
+            struct.pack_into(_STREAM_HEADER_FORMAT, packet, 0, self._index & 0xFFFFFFFF)
+            start = self._start
+            first = min(per_packet, capacity - start)
+            if codec == audio_codec.PCM16:
+                end = _STREAM_HEADER_SIZE + 2 * first
+                packet[_STREAM_HEADER_SIZE:end] = ring[start : start + first]
+                if first < per_packet:
+                    packet[end : _STREAM_HEADER_SIZE + 2 * per_packet] = ring[
+                        0 : per_packet - first
+                    ]
+                length = _STREAM_HEADER_SIZE + 2 * per_packet
+            else:
+                if first < per_packet:
+                    samples = ring[start:] + ring[0 : per_packet - first]
+                else:
+                    samples = ring_view[start : start + per_packet]
+                length = _STREAM_HEADER_SIZE + audio_codec.encode_into(
+                    packet, _STREAM_HEADER_SIZE, samples, codec, self._adpcm_state
+                )
+            service.sound_stream = self._packet_view[:length]
+            self._start = (start + per_packet) % capacity
+            self._count -= per_packet
+            self._index += per_packet
+            sent += 1
+        return sent
+
+
+class MicrophoneStreamReassembler:
+    """For clients: turn `MicrophoneService.sound_stream` packets back into a continuous
+    sample stream, keeping count of samples that were lost on the way.
+    """
+
+    def __init__(self) -> None:
+        self._next_index = None
+        # Total number of samples missing from the packets received so far.
+        self.lost_samples = 0
+        # Number of gaps in the packets received so far.
+        self.lost_chunks = 0
+        # Number of samples missing just before the last packet added.
+        self.last_gap = 0
+
+    def add(self, packet: ReadableBuffer, codec: int = audio_codec.PCM16) -> Sequence[int]:
+        """Add the next packet received and return its samples.
+        ``codec`` is the `MicrophoneService.sound_codec` the packet was sent with.
+        Packets that arrive late, after later samples, return no samples.
+        """
+        index = struct.unpack_from(_STREAM_HEADER_FORMAT, packet)[0]
+        data = memoryview(packet)[_STREAM_HEADER_SIZE:]
+        count = audio_codec.sample_count(data, codec)
+        self.last_gap = 0
+        if self._next_index is not None:
+            gap = (index - self._next_index) & 0xFFFFFFFF
+            if gap >= 0x80000000:
+                # Duplicate or out-of-order packet.
+                return ()
+            if gap:
+                self.last_gap = gap
+                self.lost_samples += gap
+                self.lost_chunks += 1
+        self._next_index = (index + count) & 0xFFFFFFFF
+        return audio_codec.decode(data, codec)
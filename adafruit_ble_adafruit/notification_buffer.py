@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.notification_buffer`
+================================================================================
+
+For clients: receive a remote characteristic's notifications instead of reading it.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import _bleio
+
+try:
+    from typing import Optional
+
+    from adafruit_ble_adafruit.adafruit_service import AdafruitService
+except ImportError:
+    pass
+
+
+class NotificationBuffer:
+    """Turn on notifications for one characteristic of a remote service, and queue
+    the values the server sends. Unlike reading the characteristic, which costs
+    a round trip to the server for every value, each value arrives once, when it is sent.
+
+    :param AdafruitService service: a remote service, as returned by
+      ``connection[TemperatureService]``.
+    :param str name: the characteristic name, such as ``"temperature"``.
+      It must have the NOTIFY property.
+    :param int buffer_size: number of notifications queued before the oldest are dropped.
+    """
+
+    def __init__(self, service: AdafruitService, name: str, *, buffer_size: int = 8) -> None:
+        self.service = service
+        self.name = name
+        descriptor = getattr(type(service), name)
+        bleio_characteristic = service.bleio_characteristics.get(name)
+        if bleio_characteristic is None:
+            for characteristic in service.bleio_service.characteristics:
+                if characteristic.uuid == descriptor.uuid.bleio_uuid:
+                    bleio_characteristic = characteristic
+                    break
+            else:
+                raise AttributeError("Characteristic not available on remote service")
+            service.bleio_characteristics[name] = bleio_characteristic
+        self._packet_buffer = _bleio.PacketBuffer(bleio_characteristic, buffer_size=buffer_size)
+        # Turn on notifications explicitly: not every _bleio does it for a PacketBuffer.
+        bleio_characteristic.set_cccd(notify=True)
+        self._packet = bytearray(descriptor.max_length or 512)
+        self._packet_view = memoryview(self._packet)
+
+    def read(self) -> Optional[memoryview]:
+        """Return the oldest queued value, or ``None`` if none are queued.
+        The returned memoryview is reused by the next call.
+        """
+        num_read = self._packet_buffer.readinto(self._packet)
+        if num_read <= 0:
+            return None
+        return self._packet_view[:num_read]
+
+    def deinit(self) -> None:
+        """Stop queueing notifications."""
+        self._packet_buffer.deinit()
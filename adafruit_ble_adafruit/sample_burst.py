@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.sample_burst`
+================================================================================
+
+Ring buffer of timestamped (x, y, z) samples, packed several to a notification
+for high-rate sensors such as accelerometers and gyroscopes.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import struct
+import time
+from array import array
+
+try:
+    from typing import List, Optional, Tuple
+
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+_HEADER_FORMAT = "<BHI"
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+_SAMPLE_FORMAT = "<Hhhh"
+_SAMPLE_SIZE = struct.calcsize(_SAMPLE_FORMAT)
+
+
+class SampleBurst:
+    """Collect (x, y, z) samples in a fixed-size ring buffer, and pack them into
+    burst packets of the form:
+
+    * count: uint8: number of samples in the packet
+    * sequence: uint16: packet sequence number, incremented for each packet,
+      so a client can detect lost packets
+    * timestamp: uint32: time of the first sample, in microseconds
+    * count samples, each:
+
+      * delta: uint16: microseconds since the previous sample (0 for the first sample),
+        limited to 65535
+      * x, y, z: int16: values divided by ``scale``
+
+    If the buffer fills before a packet is taken, the oldest samples are overwritten.
+
+    :param float scale: the value of one int16 step, such as 0.01 for 0.01 m/s^2.
+    :param int capacity: maximum number of samples held.
+    """
+
+    MAX_LENGTH = 244
+    """Largest burst packet: a 247-byte ATT MTU less the 3-byte notification header."""
+    MAX_SAMPLES = (MAX_LENGTH - _HEADER_SIZE) // _SAMPLE_SIZE
+    """Most samples that fit in one burst packet."""
+
+    def __init__(self, scale: float, capacity: int = 64) -> None:
+        self.scale = scale
+        self.capacity = capacity
+        # Samples to send per packet, as negotiated with the client. 0 means bursts are off.
+        self.samples_per_packet = 0
+        self._values = array("h", [0] * (3 * capacity))
+        self._times = array("L", [0] * capacity)
+        self._start = 0
+        self._count = 0
+        self._sequence = 0
+        self._packet = bytearray(self.MAX_LENGTH)
+        self._packet_view = memoryview(self._packet)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        """Discard all buffered samples."""
+        self._start = 0
+        self._count = 0
+
+    def add(self, values: Tuple[float, float, float], timestamp_us: Optional[int] = None) -> bool:
+        """Add one sample, timestamped now if ``timestamp_us`` is not given.
+        Return ``True`` when a packet's worth of samples is buffered, or, if bursts are off,
+        when the buffer is full and the caller should re-check ``samples_per_packet``.
+        """
+        if timestamp_us is None:
+            timestamp_us = time.monotonic_ns() // 1000
+        capacity = self.capacity
+        if self._count == capacity:
+            # Full: drop the oldest sample.
+            self._start = (self._start + 1) % capacity
+            self._count -= 1
+        index = (self._start + self._count) % capacity
+        scale = self.scale
+        base = 3 * index
+        for i in range(3):
+            scaled = round(values[i] / scale)
+            self._values[base + i] = max(-32768, min(32767, scaled))
+        self._times[index] = timestamp_us & 0xFFFFFFFF
+        self._count += 1
+        return self._count >= min(self.samples_per_packet or capacity, capacity)
+
+    def pack(self) -> memoryview:
+        """Remove up to ``samples_per_packet`` of the oldest samples and return them
+        as a burst packet. The returned memoryview is reused by the next call.
+        """
+        count = min(self._count, self.samples_per_packet or self.MAX_SAMPLES, self.MAX_SAMPLES)
+        capacity = self.capacity
+        packet = self._packet
+        values = self._values
+        times = self._times
+        index = self._start
+        struct.pack_into(_HEADER_FORMAT, packet, 0, count, self._sequence, times[index])
+        offset = _HEADER_SIZE
+        previous = times[index]
+        for _ in range(count):
+            delta = min((times[index] - previous) & 0xFFFFFFFF, 0xFFFF)
+            previous = times[index]
+            base = 3 * index
+            struct.pack_into(
+                _SAMPLE_FORMAT,
+                packet,
+                offset,
+                delta,
+                values[base],
+                values[base + 1],
+                values[base + 2],
+            )
+            offset += _SAMPLE_SIZE
+            index = (index + 1) % capacity
+        self._start = index
+        self._count -= count
+        self._sequence = (self._sequence + 1) & 0xFFFF
+        return self._packet_view[:offset]
+
+    @staticmethod
+    def decode(
+        data: ReadableBuffer, scale: float
+    ) -> Tuple[int, List[Tuple[int, Tuple[float, float, float]]]]:
+        """Unpack a burst packet received from the server.
+        Return ``(sequence, samples)``, where ``samples`` is a list of
+        ``(timestamp_us, (x, y, z))`` tuples.
+        """
+        count, sequence, timestamp = struct.unpack_from(_HEADER_FORMAT, data)
+        samples = []
+        offset = _HEADER_SIZE
+        for _ in range(count):
+            delta, x, y, z = struct.unpack_from(_SAMPLE_FORMAT, data, offset)
+            timestamp = (timestamp + delta) & 0xFFFFFFFF
+            samples.append((timestamp, (x * scale, y * scale, z * scale)))
+            offset += _SAMPLE_SIZE
+        return sequence, samples
@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.sensor_frame_service`
+================================================================================
+
+BLE access to several sensors' values, batched into one notification.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import struct
+from collections import namedtuple
+
+from adafruit_ble.attributes import Attribute
+from adafruit_ble.characteristics import Characteristic
+from adafruit_ble.characteristics.int import Uint16Characteristic
+
+from adafruit_ble_adafruit.adafruit_service import AdafruitService
+
+try:
+    from typing import Optional, Tuple
+
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+SensorFrame = namedtuple(
+    "SensorFrame",
+    ("acceleration", "gyro", "magnetic", "temperature", "humidity", "pressure", "light_level"),
+)
+"""Namedtuple of the values in one frame. Fields not present in the frame are ``None``.
+Each field has the same form and units as the characteristic of the same name
+in the corresponding single-sensor service, such as
+`AccelerometerService.acceleration` or `TemperatureService.temperature`.
+"""
+
+# (bit, struct format, size) for each SensorFrame field, in frame order.
+_FIELDS = (
+    (0x01, "<fff", 12),
+    (0x02, "<fff", 12),
+    (0x04, "<fff", 12),
+    (0x08, "<f", 4),
+    (0x10, "<f", 4),
+    (0x20, "<f", 4),
+    (0x40, "<f", 4),
+)
+
+_HEADER_FORMAT = "<H"
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+
+
+class SensorFrameService(AdafruitService):
+    """Readings from several sensors, sent together in one notification
+    instead of one notification per sensor service.
+    """
+
+    ACCELERATION = 0x01
+    """acceleration x, y, z floats, in m/s^2"""
+    GYRO = 0x02
+    """gyro x, y, z floats, in rad/s"""
+    MAGNETIC = 0x04
+    """magnetic x, y, z floats, in microteslas"""
+    TEMPERATURE = 0x08
+    """temperature float, in degrees Celsius"""
+    HUMIDITY = 0x10
+    """relative humidity float, as a percentage"""
+    PRESSURE = 0x20
+    """pressure float, in hectopascals"""
+    LIGHT_LEVEL = 0x40
+    """light level float, uncalibrated"""
+    ALL_FIELDS = 0x7F
+    """All of the fields above."""
+
+    MAX_LENGTH = _HEADER_SIZE + sum(size for _, _, size in _FIELDS)
+
+    uuid = AdafruitService.adafruit_service_uuid(0x1000)
+    frame = Characteristic(
+        uuid=AdafruitService.adafruit_service_uuid(0x1001),
+        properties=(Characteristic.READ | Characteristic.NOTIFY),
+        write_perm=Attribute.NO_ACCESS,
+        max_length=MAX_LENGTH,
+        # Empty, not zero-filled, until a frame is sent, so that values returns None.
+        initial_value=b"",
+    )
+    """
+    uint16 bitmask of the fields present, followed by the values of the present
+    fields in bit order. Vectors are three little-endian floats; other values are one float.
+
+    bit 0: acceleration (`ACCELERATION`)
+    bit 1: gyro (`GYRO`)
+    bit 2: magnetic (`MAGNETIC`)
+    bit 3: temperature (`TEMPERATURE`)
+    bit 4: humidity (`HUMIDITY`)
+    bit 5: pressure (`PRESSURE`)
+    bit 6: light level (`LIGHT_LEVEL`)
+    """
+
+    fields = Uint16Characteristic(
+        uuid=AdafruitService.adafruit_service_uuid(0x1002),
+        properties=(Characteristic.READ | Characteristic.WRITE),
+        initial_value=ALL_FIELDS,
+    )
+    """Bitmask of the fields the client wants in each frame. Initially `ALL_FIELDS`."""
+
+    measurement_period = AdafruitService.measurement_period_charac()
+    """Initially 1000ms."""
+
+    def __init__(self, service: Optional["SensorFrameService"] = None) -> None:
+        self._frame_buf = bytearray(self.MAX_LENGTH)
+        self._frame_view = memoryview(self._frame_buf)
+        super().__init__(service=service)
+
+    def set_frame(
+        self,
+        *,
+        acceleration: Optional[Tuple[float, float, float]] = None,
+        gyro: Optional[Tuple[float, float, float]] = None,
+        magnetic: Optional[Tuple[float, float, float]] = None,
+        temperature: Optional[float] = None,
+        humidity: Optional[float] = None,
+        pressure: Optional[float] = None,
+        light_level: Optional[float] = None,
+    ) -> int:
+        """Pack the given values into one frame and send it.
+        Values that are ``None``, or that the client has not asked for in `fields`,
+        are left out. Return the bitmask of the fields sent.
+        """
+        values = (acceleration, gyro, magnetic, temperature, humidity, pressure, light_level)
+        wanted = self.fields
+        buf = self._frame_buf
+        mask = 0
+        offset = _HEADER_SIZE
+        for (bit, fmt, size), value in zip(_FIELDS, values):
+            if value is None or not wanted & bit:
+                continue
+            if size == 4:
+                struct.pack_into(fmt, buf, offset, value)
+            else:
+                struct.pack_into(fmt, buf, offset, *value)
+            mask |= bit
+            offset += size
+        struct.pack_into(_HEADER_FORMAT, buf, 0, mask)
+        self.frame = self._frame_view[:offset]
+        return mask
+
+    @staticmethod
+    def decode_frame(data: ReadableBuffer) -> SensorFrame:
+        """Unpack a frame received from the server into a `SensorFrame`."""
+        mask = struct.unpack_from(_HEADER_FORMAT, data)[0]
+        offset = _HEADER_SIZE
+        values = []
+        for bit, fmt, size in _FIELDS:
+            if not mask & bit:
+                values.append(None)
+                continue
+            value = struct.unpack_from(fmt, data, offset)
+            values.append(value[0] if size == 4 else value)
+            offset += size
+        return SensorFrame(*values)
+
+    @property
+    def values(self) -> Optional[SensorFrame]:
+        """The current frame as a `SensorFrame`, or ``None`` if no frame has been sent yet."""
+        data = self.frame
+        if len(data) < _HEADER_SIZE:
+            return None
+        return self.decode_frame(data)
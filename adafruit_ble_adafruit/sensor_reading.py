@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.sensor_reading`
+================================================================================
+
+Compact encodings and sample bursts for sensor services. Only the services that
+offer them use `SensorReadingMixin`, so other services do not load this code.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+from adafruit_ble.attributes import Attribute
+from adafruit_ble.characteristics import Characteristic, StructCharacteristic
+from adafruit_ble.characteristics.float import FloatCharacteristic
+from adafruit_ble.characteristics.int import Uint8Characteristic
+
+from adafruit_ble_adafruit.adafruit_service import AdafruitService
+from adafruit_ble_adafruit.compact_encoding import CompactEncoding
+from adafruit_ble_adafruit.sample_burst import SampleBurst
+
+try:
+    from typing import Optional, Tuple, Union
+except ImportError:
+    pass
+
+
+class SensorReadingMixin:
+    """For `AdafruitService` subclasses whose sensor value can be sent in a compact
+    encoding, and optionally in `SampleBurst` packets. List it before `AdafruitService`::
+
+        class TemperatureService(SensorReadingMixin, AdafruitService):
+
+    and set ``_reading_name`` and ``_reading_count``.
+    """
+
+    # The name of the service's float characteristic, and the number of floats in it.
+    _reading_name = None
+    _reading_count = 1
+    _compact_encoding = None
+
+    @classmethod
+    def burst_charac(cls) -> Characteristic:
+        """Create a burst Characteristic carrying `SampleBurst` packets, for use by a subclass."""
+        return Characteristic(
+            uuid=AdafruitService.adafruit_service_uuid(0x0003),
+            properties=(Characteristic.READ | Characteristic.NOTIFY),
+            write_perm=Attribute.NO_ACCESS,
+            max_length=SampleBurst.MAX_LENGTH,
+        )
+
+    @classmethod
+    def samples_per_packet_charac(cls) -> Uint8Characteristic:
+        """Create a samples_per_packet Characteristic for use by a subclass.
+        The client writes the number of samples it wants in each burst packet;
+        0, the initial value, turns bursts off.
+        """
+        return Uint8Characteristic(
+            uuid=AdafruitService.adafruit_service_uuid(0x0004),
+            properties=(Characteristic.READ | Characteristic.WRITE),
+            initial_value=0,
+            max_value=SampleBurst.MAX_SAMPLES,
+        )
+
+    @classmethod
+    def burst_scale_charac(cls, scale: float) -> FloatCharacteristic:
+        """Create a burst_scale Characteristic giving the value of one int16 step
+        in burst packets, for use by a subclass.
+        """
+        return FloatCharacteristic(
+            uuid=AdafruitService.adafruit_service_uuid(0x0005),
+            properties=Characteristic.READ,
+            write_perm=Attribute.NO_ACCESS,
+            initial_value=scale,
+        )
+
+    @classmethod
+    def encoding_charac(cls) -> Uint8Characteristic:
+        """Create an encoding Characteristic for use by a subclass. The client writes
+        `CompactEncoding.INT16` or `CompactEncoding.INT24` to have values sent in the
+        compact characteristic instead of as floats. Initially `CompactEncoding.FLOAT32`.
+        """
+        return Uint8Characteristic(
+            uuid=AdafruitService.adafruit_service_uuid(0x0006),
+            properties=(Characteristic.READ | Characteristic.WRITE),
+            initial_value=CompactEncoding.FLOAT32,
+            max_value=CompactEncoding.INT24,
+        )
+
+    @classmethod
+    def encoding_scale_charac(cls, scale: float, offset: float = 0.0) -> StructCharacteristic:
+        """Create an encoding_scale Characteristic, a tuple (scale, offset) of floats
+        describing the compact encoding, for use by a subclass.
+        """
+        return StructCharacteristic(
+            "<ff",
+            uuid=AdafruitService.adafruit_service_uuid(0x0007),
+            properties=Characteristic.READ,
+            write_perm=Attribute.NO_ACCESS,
+            initial_value=(scale, offset),
+        )
+
+    @classmethod
+    def compact_charac(cls, count: int = 1) -> Characteristic:
+        """Create a compact Characteristic holding ``count`` values in the compact encoding,
+        for use by a subclass.
+        """
+        return Characteristic(
+            uuid=AdafruitService.adafruit_service_uuid(0x0008),
+            properties=(Characteristic.READ | Characteristic.NOTIFY),
+            write_perm=Attribute.NO_ACCESS,
+            max_length=CompactEncoding.size(CompactEncoding.INT24) * count,
+        )
+
+    def _compact_encoder(self) -> CompactEncoding:
+        encoder = self._compact_encoding
+        if encoder is None:
+            # Read the scale only once; it does not change.
+            scale, offset = self.encoding_scale
+            encoder = CompactEncoding(scale, offset, self._reading_count)
+            self._compact_encoding = encoder
+        return encoder
+
+    @property
+    def reading(self) -> Union[float, Tuple[float, ...]]:
+        """The service's sensor value, such as ``temperature`` or ``acceleration``,
+        in whichever encoding the client has chosen in ``encoding``.
+        Setting this on the server sends the value either in the float characteristic
+        or in the ``compact`` characteristic. Getting it on a client decodes whichever
+        one is in use.
+        """
+        encoding = self.encoding
+        if encoding == CompactEncoding.FLOAT32:
+            return getattr(self, self._reading_name)
+        return self._compact_encoder().decode(self.compact, encoding)
+
+    @reading.setter
+    def reading(self, value: Union[float, Tuple[float, ...]]) -> None:
+        encoding = self.encoding
+        if encoding == CompactEncoding.FLOAT32:
+            setattr(self, self._reading_name, value)
+        else:
+            self.compact = self._compact_encoder().encode(value, encoding)
+
+    def _add_burst_sample(
+        self, burst: SampleBurst, values: Tuple[float, float, float], timestamp_us: Optional[int]
+    ) -> None:
+        if not burst.add(values, timestamp_us):
+            return
+        # Read the negotiated count only once per packet, not once per sample.
+        burst.samples_per_packet = self.samples_per_packet
+        if burst.samples_per_packet:
+            self.burst = burst.pack()
+        else:
+            # Bursts are off: nobody wants these samples.
+            burst.clear()
@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.sensor_scheduler`
+================================================================================
+
+Deadline-ordered updating of sensor services, so a server sleeps until the
+next sensor is due instead of spinning over every service.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import time
+
+from adafruit_ble_adafruit.adafruit_service import AdafruitService
+
+try:
+    from typing import Any, Callable, List, Optional
+except ImportError:
+    pass
+
+
+def _monotonic_msecs() -> int:
+    return time.monotonic_ns() // 1000000
+
+
+def _heappush(heap: List, item: List) -> None:
+    heap.append(item)
+    pos = len(heap) - 1
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if heap[parent] <= item:
+            break
+        heap[pos] = heap[parent]
+        pos = parent
+    heap[pos] = item
+
+
+def _heappop(heap: List) -> List:
+    last = heap.pop()
+    if not heap:
+        return last
+    top = heap[0]
+    size = len(heap)
+    pos = 0
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap[child + 1] < heap[child]:
+            child += 1
+        if last <= heap[child]:
+            break
+        heap[pos] = heap[child]
+        pos = child
+    heap[pos] = last
+    return top
+
+
+class _ScheduledSensor:
+    """One registered (service, characteristic, reader) combination."""
+
+    def __init__(
+        self,
+        service: AdafruitService,
+        characteristic: Optional[str],
+        reader: Callable[[], Any],
+    ) -> None:
+        if characteristic is not None and characteristic == getattr(service, "_reading_name", None):
+            # Set the float characteristic through reading, so clients that chose
+            # a compact encoding get the values too.
+            characteristic = "reading"
+        self.service = service
+        self.characteristic = characteristic
+        self.reader = reader
+        self.period = 0
+        self.last_value = None
+        self.removed = False
+
+    def refresh_period(self) -> int:
+        """Pick up any change to the service's measurement_period. Services without one
+        are treated as notify-on-change.
+        """
+        service = self.service
+        service.refresh_measurement_period()
+        self.period = service.cached_measurement_period
+        return self.period
+
+    def sample(self) -> None:
+        """Call the reader and store its value in the characteristic, if any."""
+        self.store(self.reader())
+
+    def store(self, value: Any) -> None:
+        """Store a value returned by the reader in the characteristic, if any."""
+        if self.characteristic is None:
+            return
+        if self.period == AdafruitService.MEASUREMENT_PERIOD_ON_CHANGE:
+            # Only numbers and tuples of them can be compared. Anything else, such as
+            # a buffer of samples, which may be reused, is always sent.
+            if isinstance(value, (int, float, tuple)):
+                if value == self.last_value:
+                    return
+                self.last_value = value
+        # update() applies any deadband set on the service.
+        self.service.update(self.characteristic, value)
+
+
+class SensorScheduler:
+    """Update sensor services when their ``measurement_period`` says they are due.
+
+    Registered sensors are kept in a min-heap ordered by their next deadline.
+    Each sensor's ``measurement_period`` is checked with
+    `AdafruitService.refresh_measurement_period()` once each time it fires, rather than
+    read once per pass through the server loop, and the cached value decides its next deadline.
+
+    A ``measurement_period`` of 0 means "notify on change": the reader is polled every
+    ``change_poll_period`` msecs, and the characteristic is written only when the value
+    differs from the last one written. Values other than numbers and tuples, such as
+    buffers of samples, are written every time. A ``measurement_period`` of -1 means "stop":
+    the reader is not called, and the period is re-checked every ``stopped_poll_period``
+    msecs in case the client restarts it.
+
+    :param int change_poll_period: polling interval in msecs for notify-on-change sensors.
+    :param int stopped_poll_period: interval in msecs to re-check stopped sensors.
+    """
+
+    def __init__(self, *, change_poll_period: int = 20, stopped_poll_period: int = 1000) -> None:
+        self.change_poll_period = change_poll_period
+        self.stopped_poll_period = stopped_poll_period
+        self._heap = []
+        # Tie-breaker so that heap entries never compare _ScheduledSensor objects.
+        self._count = 0
+
+    def add(
+        self,
+        service: AdafruitService,
+        characteristic: Optional[str],
+        reader: Callable[[], Any],
+    ) -> None:
+        """Register a sensor reader for ``service``.
+
+        :param AdafruitService service: the service to update.
+        :param str characteristic: name of the characteristic to set from the value
+          returned by ``reader``, such as ``"reading"`` or ``"pressed"``. The float
+          characteristic of a `SensorReadingMixin` service, such as ``"temperature"``,
+          is set through ``reading``, in the client's chosen encoding. If ``None``,
+          ``reader`` is called only for its side effects, for example
+          ``ButtonService.set_pressed()``.
+        :param reader: a callable with no arguments that reads the sensor.
+        """
+        self._push(_monotonic_msecs(), _ScheduledSensor(service, characteristic, reader))
+
+    def remove(self, service: AdafruitService) -> None:
+        """Stop updating all the readers registered for ``service``."""
+        for entry in self._heap:
+            if entry[2].service is service:
+                entry[2].removed = True
+
+    def _push(self, deadline: int, sensor: _ScheduledSensor) -> None:
+        self._count += 1
+        _heappush(self._heap, [deadline, self._count, sensor])
+
+    def run_pending(self) -> Optional[int]:
+        """Update every sensor that is due. Return the number of msecs until the next
+        sensor is due, or ``None`` if no sensors are registered.
+        """
+        heap = self._heap
+        now = _monotonic_msecs()
+        while heap and heap[0][0] <= now:
+            deadline, _, sensor = _heappop(heap)
+            if sensor.removed:
+                continue
+            period = sensor.refresh_period()
+            if period <= AdafruitService.MEASUREMENT_PERIOD_STOP:
+                interval = self.stopped_poll_period
+            else:
+                sensor.sample()
+                interval = (
+                    self.change_poll_period
+                    if period == AdafruitService.MEASUREMENT_PERIOD_ON_CHANGE
+                    else period
+                )
+            next_deadline = deadline + interval
+            if next_deadline <= now:
+                # Fell behind; don't try to catch up with a burst of updates.
+                next_deadline = now + interval
+            self._push(next_deadline, sensor)
+        if not heap:
+            return None
+        return max(0, heap[0][0] - _monotonic_msecs())
+
+    def sleep_until_due(self, max_msecs: Optional[int] = None) -> None:
+        """Update any sensors that are due, then sleep until the next one is due,
+        but no longer than ``max_msecs``, if given. Use ``max_msecs`` to keep polling
+        input services such as `ToneService` often enough.
+        """
+        delay = self.run_pending()
+        if delay is None or (max_msecs is not None and delay > max_msecs):
+            delay = max_msecs
+        if delay:
+            time.sleep(delay / 1000)
+
+    def run(self, keep_running: Callable[[], bool], *, max_msecs: Optional[int] = None) -> None:
+        """Update sensors as they come due for as long as ``keep_running()`` is ``True``,
+        for example ``scheduler.run(lambda: ble.connected)``.
+        """
+        while keep_running():
+            self.sleep_until_due(max_msecs)
@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.server_scanner`
+================================================================================
+
+Fast scanning for many boards sending `AdafruitServerAdvertisement`: the PID is
+read straight from the raw advertising bytes, without building Advertisement objects.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import time
+from collections import namedtuple
+
+from adafruit_ble_adafruit.adafruit_service import AdafruitServerAdvertisement
+
+try:
+    from typing import Any, Iterator, Optional, Tuple
+
+    from adafruit_ble import BLERadio
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+ServerRecord = namedtuple("ServerRecord", ("address", "pid", "rssi"))
+"""A board heard advertising: its ``_bleio.Address``, which can be passed to
+``BLERadio.connect()``, its USB PID, and the RSSI of the advertisement."""
+
+# The bytes that precede the PID in the manufacturer data structure,
+# after that structure's length byte.
+_PID_PREFIX = AdafruitServerAdvertisement.match_prefixes[0]
+
+
+def advertised_pid(data: ReadableBuffer) -> Optional[int]:
+    """Return the PID in raw advertising ``data`` sent by an `AdafruitServerAdvertisement`,
+    or ``None`` if there is none.
+    """
+    prefix = _PID_PREFIX
+    prefix_len = len(prefix)
+    size = len(data)
+    i = 0
+    while i < size:
+        length = data[i]
+        if length == 0:
+            break
+        end = i + 1 + length
+        if end > size:
+            # Truncated structure.
+            break
+        if length >= prefix_len + 2:
+            start = i + 1
+            for j in range(prefix_len):
+                if data[start + j] != prefix[j]:
+                    break
+            else:
+                pid_at = start + prefix_len
+                return data[pid_at] | (data[pid_at + 1] << 8)
+        i = end
+    return None
+
+
+class ServerScanner:
+    """Scan for boards sending `AdafruitServerAdvertisement`, and yield a `ServerRecord`
+    for each board heard. A board is reported again only after ``ttl`` seconds,
+    or sooner if its PID changes, so a dense room of boards advertising many times a second
+    gives a manageable stream of records.
+
+    :param BLERadio ble: the radio.
+    :param float ttl: seconds before a board already reported is reported again.
+    :param int max_entries: when more boards than this are remembered,
+      boards not heard within ``ttl`` are forgotten.
+    """
+
+    def __init__(self, ble: BLERadio, *, ttl: float = 10.0, max_entries: int = 1024) -> None:
+        self._ble = ble
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # (monotonic time reported, pid), by address bytes.
+        self._seen = {}
+
+    def forget(self) -> None:
+        """Forget all the boards reported so far, so each is reported again when next heard."""
+        self._seen = {}
+
+    def _prune(self, now: float) -> None:
+        ttl = self.ttl
+        self._seen = {address: seen for address, seen in self._seen.items() if now - seen[0] < ttl}
+
+    def _heard(self, **kwargs: Any) -> Iterator[Tuple[Any, int, int]]:
+        """Yield (address, pid, rssi) for each advertisement with a PID."""
+        # BLERadio keeps its _bleio.Adapter private; scanning the adapter directly
+        # skips building an Advertisement for every packet. Fall back to the
+        # public BLERadio.start_scan() where the adapter is not available.
+        adapter = getattr(self._ble, "_adapter", None)
+        if adapter is None or not hasattr(adapter, "start_scan"):
+            for advertisement in self._ble.start_scan(
+                AdafruitServerAdvertisement, active=False, **kwargs
+            ):
+                pid = advertisement.pid
+                if pid is not None:
+                    yield advertisement.address, pid, advertisement.rssi
+            return
+        for entry in adapter.start_scan(
+            prefixes=AdafruitServerAdvertisement.get_prefix_bytes(), active=False, **kwargs
+        ):
+            pid = advertised_pid(entry.advertisement_bytes)
+            if pid is not None:
+                yield entry.address, pid, entry.rssi
+
+    def scan(
+        self,
+        *,
+        timeout: Optional[float] = None,
+        minimum_rssi: int = -80,
+        buffer_size: int = 512,
+        interval: float = 0.1,
+        window: float = 0.1,
+    ) -> Iterator[ServerRecord]:
+        """Scan, and yield a `ServerRecord` for each board heard, subject to ``ttl``.
+        The arguments are passed on to ``start_scan()``; the scan is passive,
+        since the PID is in the advertisement and no scan response is needed.
+        Call ``BLERadio.stop_scan()`` to stop early.
+        """
+        for address, pid, rssi in self._heard(
+            buffer_size=buffer_size,
+            timeout=timeout,
+            interval=interval,
+            window=window,
+            minimum_rssi=minimum_rssi,
+        ):
+            key = address.address_bytes
+            now = time.monotonic()
+            seen = self._seen
+            last = seen.get(key)
+            if last is not None and now - last[0] < self.ttl and last[1] == pid:
+                continue
+            if last is None and len(seen) >= self.max_entries:
+                self._prune(now)
+                seen = self._seen
+            seen[key] = (now, pid)
+            yield ServerRecord(address, pid, rssi)
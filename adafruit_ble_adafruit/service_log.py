@@ -0,0 +1,288 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.service_log`
+================================================================================
+
+For clients: a compact binary log of characteristic values received from boards,
+and a reader and replayer, so recorded sessions can be processed without radios.
+
+A log starts with the 5-byte header ``b"ABLG\\x01"``, followed by records, each:
+
+* service: uint16: the 16-bit value in the service's Adafruit UUID,
+  such as 0x0100 for `TemperatureService`
+* number: uint16: the 16-bit value in the characteristic's Adafruit UUID,
+  such as 0x0101 for `TemperatureService.temperature`. Characteristics that every
+  service has, such as ``measurement_period``, have the same number in every service.
+* source: varint: which board the value came from, numbered in order of appearance
+* delta: varint: msecs since the previous record's timestamp
+* length: varint: number of data bytes
+* data: the raw characteristic value
+
+A record with service 0 introduces a new board: its data is the board's address bytes,
+and it takes the next source number, starting from 0.
+A record cut short at the end of the log, as by power loss while writing, is ignored.
+Varints are unsigned LEB128: 7 bits per byte, low bits first, high bit set on all but
+the last byte.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import struct
+import time
+from collections import namedtuple
+
+from adafruit_ble_adafruit import client_proxy, load_service
+from adafruit_ble_adafruit.adafruit_service import AdafruitService
+
+try:
+    from typing import Any, BinaryIO, Iterable, Iterator, Optional, Tuple, Type
+
+    from circuitpython_typing import ReadableBuffer
+
+    from adafruit_ble_adafruit.gateway import GatewayEvent
+except ImportError:
+    pass
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+HEADER = b"ABLG\x01"
+"""The bytes at the start of every log."""
+
+_SOURCE_RECORD = 0
+
+LogRecord = namedtuple("LogRecord", ("timestamp", "address", "service", "number", "data"))
+"""One value read from a log: the timestamp in msecs, the board's address bytes,
+the service's and the characteristic's 16-bit numbers, and the raw value as
+a memoryview into the log."""
+
+# The proxy classes whose decode_value() decodes each characteristic,
+# by (service number, characteristic number). Filled in on first use.
+_decoders = {}
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: ReadableBuffer, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, offset
+        shift += 7
+
+
+def service_number(service_class: Type[AdafruitService]) -> int:
+    """The 16-bit number in the Adafruit UUID of ``service_class``."""
+    return AdafruitService.adafruit_service_number(service_class.uuid)
+
+
+def characteristic_number(service_class: Type[AdafruitService], name: str) -> int:
+    """The 16-bit number in the Adafruit UUID of characteristic ``name`` of ``service_class``."""
+    return AdafruitService.adafruit_service_number(getattr(service_class, name).uuid)
+
+
+def decode(service: int, number: int, data: ReadableBuffer) -> Any:
+    """Decode a recorded value of the characteristic with 16-bit ``number`` in the service
+    with 16-bit number ``service``, as the
+    `client_proxy` proxy for that characteristic does. Values of characteristics that
+    have no proxy are returned as ``bytes``.
+    """
+    if not _decoders:
+        for proxy in (
+            client_proxy.AccelerometerProxy,
+            client_proxy.BarometricPressureProxy,
+            client_proxy.ButtonProxy,
+            client_proxy.ColorSensorProxy,
+            client_proxy.GestureProxy,
+            client_proxy.GyroscopeProxy,
+            client_proxy.HumidityProxy,
+            client_proxy.LightSensorProxy,
+            client_proxy.MagnetometerProxy,
+            client_proxy.ProximityProxy,
+            client_proxy.QuaternionProxy,
+            client_proxy.SensorFrameProxy,
+            client_proxy.TemperatureProxy,
+        ):
+            service_class = load_service(proxy.service_name)
+            key = (
+                service_number(service_class),
+                characteristic_number(service_class, proxy.characteristic),
+            )
+            _decoders[key] = proxy
+    proxy = _decoders.get((service, number))
+    if proxy is None:
+        return bytes(data)
+    return proxy.decode_value(data)
+
+
+class ServiceLogWriter:
+    """Append values to a log in an open binary file. The header is written first.
+
+    :param file: a file opened for writing in binary mode.
+    """
+
+    def __init__(self, file: BinaryIO) -> None:
+        self._file = file
+        self._previous = 0
+        # Source number, by address bytes.
+        self._sources = {}
+        # (service number, characteristic number), by (service class, name).
+        self._numbers = {}
+        self._record = bytearray()
+        file.write(HEADER)
+
+    def _append(
+        self, service: int, number: int, source: int, timestamp: int, data: ReadableBuffer
+    ) -> None:
+        record = self._record
+        record[:] = struct.pack("<HH", service, number)
+        _write_varint(record, source)
+        _write_varint(record, max(0, timestamp - self._previous))
+        _write_varint(record, len(data))
+        record.extend(data)
+        self._file.write(record)
+        self._previous = max(self._previous, timestamp)
+
+    def write(
+        self, timestamp: int, address: bytes, service: int, number: int, data: ReadableBuffer
+    ) -> None:
+        """Append a value.
+
+        :param int timestamp: when the value arrived, in msecs.
+        :param bytes address: the board's address bytes.
+        :param int service: the service's 16-bit number; see `service_number()`.
+        :param int number: the characteristic's 16-bit number; see `characteristic_number()`.
+        :param data: the raw characteristic value.
+        """
+        source = self._sources.get(address)
+        if source is None:
+            source = len(self._sources)
+            self._sources[address] = source
+            self._append(_SOURCE_RECORD, 0, source, timestamp, address)
+        self._append(service, number, source, timestamp, data)
+
+    def write_event(self, event: GatewayEvent) -> bool:
+        """Append the value in a `GatewayEvent` notification.
+        Return ``False``, and write nothing, for other events.
+        """
+        if event.data is None:
+            return False
+        key = (event.service, event.characteristic)
+        numbers = self._numbers.get(key)
+        if numbers is None:
+            numbers = (
+                service_number(event.service),
+                characteristic_number(event.service, event.characteristic),
+            )
+            self._numbers[key] = numbers
+        self.write(event.timestamp, event.address.address_bytes, *numbers, event.data)
+        return True
+
+
+class ServiceLogReader:
+    """Read a log, memory-mapped where ``mmap`` is available, so that scanning a large log
+    does not read it all into memory. The ``data`` in each `LogRecord` is a view into the
+    log, valid until `close()`.
+
+    :param str path: the log file.
+    :raises ValueError: if the file does not start with `HEADER`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        self._mmap = None
+        try:
+            if mmap is not None:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._data = memoryview(self._mmap)
+            else:
+                self._data = memoryview(self._file.read())
+        except ValueError:
+            # An empty file cannot be mapped.
+            self._data = memoryview(b"")
+        if bytes(self._data[: len(HEADER)]) != HEADER:
+            self.close()
+            raise ValueError("not a service log")
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        data = self._data
+        size = len(data)
+        offset = len(HEADER)
+        timestamp = 0
+        addresses = []
+        while offset + 4 <= size:
+            service = data[offset] | (data[offset + 1] << 8)
+            number = data[offset + 2] | (data[offset + 3] << 8)
+            try:
+                source, offset = _read_varint(data, offset + 4)
+                delta, offset = _read_varint(data, offset)
+                length, offset = _read_varint(data, offset)
+            except IndexError:
+                # The last record was cut short.
+                return
+            if offset + length > size:
+                return
+            value = data[offset : offset + length]
+            offset += length
+            timestamp += delta
+            if service == _SOURCE_RECORD:
+                addresses.append(bytes(value))
+                continue
+            yield LogRecord(timestamp, addresses[source], service, number, value)
+
+    def close(self) -> None:
+        """Close the log."""
+        self._data.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Records still refer to the log; it is unmapped when they are freed.
+                pass
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self) -> "ServiceLogReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def replay(
+    records: Iterable[LogRecord], *, speed: Optional[float] = 1.0
+) -> Iterator[Tuple[LogRecord, Any]]:
+    """Yield ``(record, value)`` for each record, where ``value`` is the record's
+    data decoded with `decode()`.
+
+    :param records: the records to replay, such as a `ServiceLogReader`.
+    :param float speed: 1.0 yields the records with their original spacing in time,
+      2.0 twice as fast, and so on. ``None`` yields them as fast as possible.
+    """
+    start = None
+    for record in records:
+        if speed is not None:
+            if start is None:
+                start = (record.timestamp, time.monotonic())
+            due = start[1] + (record.timestamp - start[0]) / 1000 / speed
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        yield record, decode(record.service, record.number, record.data)
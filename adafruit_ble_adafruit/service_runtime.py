@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_ble_adafruit.service_runtime`
+================================================================================
+
+Run a server's services as ``asyncio`` tasks: one task per sensor, each sleeping
+until its ``measurement_period`` is up, and one task per input service,
+polling for packets written by the client.
+
+Works with CPython's ``asyncio`` and with the CircuitPython ``asyncio`` library.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
+
+import asyncio
+
+from adafruit_ble_adafruit.adafruit_service import AdafruitService
+from adafruit_ble_adafruit.sensor_scheduler import _monotonic_msecs, _ScheduledSensor
+
+try:
+    from typing import Any, Callable, Optional
+
+    from circuitpython_typing import WriteableBuffer
+
+    from adafruit_ble_adafruit.addressable_pixel_service import AddressablePixelService
+    from adafruit_ble_adafruit.tone_service import TonePlayer
+except ImportError:
+    pass
+
+
+class ServiceRuntime:
+    """Update sensor services and poll input services concurrently, as ``asyncio`` tasks.
+
+    Each sensor registered with `add_sensor()` gets its own task, which sleeps until
+    the sensor is due according to its ``measurement_period``, with the same meaning of
+    0 ("notify on change") and -1 ("stop") as in `SensorScheduler`. So a sensor with a
+    long period never delays one with a short period while it waits.
+
+    A reader can be a plain function or an ``async def`` coroutine function.
+    A plain function blocks every task while it runs, which is fine for fast reads.
+    For a slow sensor, such as a barometer that needs a conversion time, write an
+    ``async def`` reader that starts the conversion, does ``await asyncio.sleep()``
+    for the conversion time, then reads the result; other tasks, such as button
+    notifications, run meanwhile.
+
+    :param int change_poll_period: polling interval in msecs for notify-on-change sensors.
+    :param int stopped_poll_period: interval in msecs to re-check stopped sensors.
+    :param int input_poll_period: interval in msecs at which input services are
+      checked for new packets, and ``keep_running`` is checked by `run()`.
+    """
+
+    def __init__(
+        self,
+        *,
+        change_poll_period: int = 20,
+        stopped_poll_period: int = 1000,
+        input_poll_period: int = 10,
+    ) -> None:
+        self.change_poll_period = change_poll_period
+        self.stopped_poll_period = stopped_poll_period
+        self.input_poll_period = input_poll_period
+        self._sensors = []
+        self._inputs = []
+
+    def add_sensor(
+        self,
+        service: AdafruitService,
+        characteristic: Optional[str],
+        reader: Callable[[], Any],
+    ) -> None:
+        """Register a sensor reader for ``service``. The arguments are the same as for
+        `SensorScheduler.add()`, except that ``reader`` may also be a coroutine function.
+        """
+        self._sensors.append(_ScheduledSensor(service, characteristic, reader))
+
+    def add_input(self, poll: Callable[[], Any], period: Optional[int] = None) -> None:
+        """Call ``poll`` every ``period`` msecs, or every ``input_poll_period`` msecs
+        if ``period`` is not given. ``poll`` may also be a coroutine function.
+        """
+        self._inputs.append((poll, self.input_poll_period if period is None else period))
+
+    def add_tone_player(self, player: TonePlayer) -> None:
+        """Keep ``player`` checking for new tones and starting and stopping notes."""
+        self.add_input(player.update)
+
+    def add_pixels(
+        self,
+        service: AddressablePixelService,
+        pixel_buffer: WriteableBuffer,
+        show: Callable[[WriteableBuffer], None],
+    ) -> None:
+        """Copy pixel data sent to ``service`` into ``pixel_buffer``, and call
+        ``show(pixel_buffer)`` when a packet asks for the pixels to be written.
+        All queued packets are handled on each poll.
+        """
+
+        def poll() -> None:
+            while True:
+                write_now = service.readinto_pixels(pixel_buffer)
+                if write_now is None:
+                    return
+                if write_now:
+                    show(pixel_buffer)
+
+        self.add_input(poll)
+
+    async def _sensor_task(self, sensor: _ScheduledSensor) -> None:
+        deadline = _monotonic_msecs()
+        while True:
+            period = sensor.refresh_period()
+            if period <= AdafruitService.MEASUREMENT_PERIOD_STOP:
+                interval = self.stopped_poll_period
+            else:
+                sensor.store(await _call(sensor.reader))
+                interval = (
+                    self.change_poll_period
+                    if period == AdafruitService.MEASUREMENT_PERIOD_ON_CHANGE
+                    else period
+                )
+            now = _monotonic_msecs()
+            deadline += interval
+            if deadline <= now:
+                # Fell behind; don't try to catch up with a burst of updates.
+                deadline = now + interval
+            await asyncio.sleep((deadline - now) / 1000)
+
+    @staticmethod
+    async def _input_task(poll: Callable[[], Any], period: int) -> None:
+        while True:
+            await _call(poll)
+            await asyncio.sleep(period / 1000)
+
+    async def run(self, keep_running: Callable[[], bool]) -> None:
+        """Run all the registered sensors and inputs for as long as ``keep_running()``
+        is ``True``, then cancel their tasks. For example::
+
+            asyncio.run(runtime.run(lambda: ble.connected))
+
+        If a reader or input raises an exception, the other tasks are cancelled
+        and the exception is raised from `run()`.
+        """
+        tasks = [asyncio.create_task(self._sensor_task(sensor)) for sensor in self._sensors]
+        tasks.extend(asyncio.create_task(self._input_task(*entry)) for entry in self._inputs)
+        try:
+            while keep_running():
+                for task in tasks:
+                    if task.done():
+                        # The tasks loop forever, so this one raised: pass the error on.
+                        await task
+                await asyncio.sleep(self.input_poll_period / 1000)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _call(function: Callable[[], Any]) -> Any:
+    """Call ``function``, and await the result if it is a coroutine."""
+    result = function()
+    # CircuitPython coroutines are generators, so check for send() rather than
+    # using inspect or asyncio.iscoroutine().
+    if hasattr(result, "send"):
+        result = await result
+    return result
@@ -19,9 +19,10 @@ from adafruit_ble.characteristics import Characteristic
 from adafruit_ble.characteristics.float import FloatCharacteristic
 
 from adafruit_ble_adafruit.adafruit_service import AdafruitService
+from adafruit_ble_adafruit.sensor_reading import SensorReadingMixin
 
 
-class TemperatureService(AdafruitService):
+class TemperatureService(SensorReadingMixin, AdafruitService):
     """Temperature sensor."""
 
     uuid = AdafruitService.adafruit_service_uuid(0x100)
@@ -33,3 +34,12 @@ class TemperatureService(AdafruitService):
     """Temperature in degrees Celsius (float)."""
     measurement_period = AdafruitService.measurement_period_charac()
     """Initially 1000ms."""
+
+    _reading_name = "temperature"
+    _reading_count = 1
+    encoding = SensorReadingMixin.encoding_charac()
+    """`CompactEncoding` used by `reading`. Initially 0: floats in ``temperature``."""
+    encoding_scale = SensorReadingMixin.encoding_scale_charac(0.01)
+    """(scale, offset) of the compact encoding: one step is 0.01 degrees Celsius."""
+    compact = SensorReadingMixin.compact_charac()
+    """``temperature`` in the compact `encoding`, when the client has chosen one."""
@@ -15,6 +15,7 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BLE_Adafruit.git"
 
 import struct
+import time
 
 from _bleio import PacketBuffer
 from adafruit_ble.attributes import Attribute
@@ -23,7 +24,7 @@ from adafruit_ble.characteristics import Characteristic, ComplexCharacteristic
 from adafruit_ble_adafruit.adafruit_service import AdafruitService
 
 try:
-    from typing import Optional, Tuple
+    from typing import Callable, List, Optional, Sequence, Tuple
 except ImportError:
     pass
 
@@ -45,7 +46,30 @@ class _TonePacket(ComplexCharacteristic):
     def bind(self, service: "ToneService") -> PacketBuffer:
         """Binds the characteristic to the given Service."""
         bound_characteristic = super().bind(service)
-        return PacketBuffer(bound_characteristic, buffer_size=1)
+        return PacketBuffer(bound_characteristic, buffer_size=service.packet_queue_depth)
+
+
+class _MelodyPacket(ComplexCharacteristic):
+    """
+    A sequence of notes, each (frequency: uint16, in Hz, duration: uint32, in msecs),
+    to be played one after another. A frequency of 0 is a rest.
+    """
+
+    uuid = AdafruitService.adafruit_service_uuid(0xC02)
+
+    MAX_NOTES = 512 // _TonePacket.format_size
+
+    def __init__(self) -> None:
+        super().__init__(
+            properties=Characteristic.WRITE,
+            read_perm=Attribute.NO_ACCESS,
+            max_length=self.MAX_NOTES * _TonePacket.format_size,
+        )
+
+    def bind(self, service: "ToneService") -> PacketBuffer:
+        """Binds the characteristic to the given Service."""
+        bound_characteristic = super().bind(service)
+        return PacketBuffer(bound_characteristic, buffer_size=service.packet_queue_depth)
 
 
 class ToneService(AdafruitService):
@@ -59,15 +83,26 @@ class ToneService(AdafruitService):
     if duration == 0, play indefinitely.
     """
 
-    def __init__(self, service: Optional["ToneService"] = None) -> None:
+    _melody_packet = _MelodyPacket()
+    """
+    Sequence of (frequency: 16 bits, in Hz, duration: 32 bits, in msecs) notes
+    to play one after another. A frequency of 0 is a rest.
+    """
+
+    def __init__(
+        self, service: Optional["ToneService"] = None, *, packet_queue_depth: int = 1
+    ) -> None:
+        # Use more than 1 if clients send bursts of tones.
+        self.packet_queue_depth = packet_queue_depth
         super().__init__(service=service)
         self._tone_packet_buf = bytearray(_TonePacket.format_size)
+        self._melody_packet_buf = bytearray(_MelodyPacket.MAX_NOTES * _TonePacket.format_size)
 
     @property
     def tone(self) -> Optional[Tuple[int, int]]:
         """Return (frequency, duration), or None if no value available"""
         buf = self._tone_packet_buf
-        if self._tone_packet.readinto(buf) == 0:
+        if self._count_packet("_tone_packet", self._tone_packet.readinto(buf)) == 0:
             # No new values available.
             return None
         return struct.unpack(_TonePacket.format, buf)
@@ -82,3 +117,109 @@ class ToneService(AdafruitService):
             frequency,
             0 if duration == 0 else int(duration * 1000 + 0.5),
         )
+
+    @property
+    def melody(self) -> Optional[List[Tuple[int, int]]]:
+        """Return a list of (frequency, duration) notes, or None if no value available"""
+        buf = self._melody_packet_buf
+        num_read = self._count_packet("_melody_packet", self._melody_packet.readinto(buf))
+        if num_read == 0:
+            # No new values available.
+            return None
+        return [
+            struct.unpack_from(_TonePacket.format, buf, offset)
+            for offset in range(0, num_read - _TonePacket.format_size + 1, _TonePacket.format_size)
+        ]
+
+    def play_melody(self, notes: Sequence[Tuple[int, float]]) -> None:
+        """
+        Play a sequence of (frequency, duration) notes, in one write.
+        Frequency is in Hz; a frequency of 0 is a rest. Duration is in seconds.
+        """
+        notes = notes[: _MelodyPacket.MAX_NOTES]
+        buf = bytearray(len(notes) * _TonePacket.format_size)
+        for i, (frequency, duration) in enumerate(notes):
+            struct.pack_into(
+                _TonePacket.format,
+                buf,
+                i * _TonePacket.format_size,
+                frequency,
+                int(duration * 1000 + 0.5),
+            )
+        self._melody_packet.write(buf)
+
+
+class TonePlayer:
+    """Play the tones and melodies sent to a `ToneService` without blocking,
+    by timing each note against the monotonic clock instead of sleeping.
+    Call `update()` often, such as on every pass through the server loop.
+
+    A new tone or melody replaces whatever is playing.
+
+    :param ToneService service: the local service.
+    :param start_tone: called with a frequency in Hz to start playing a tone,
+      such as ``clue.start_tone``.
+    :param stop_tone: called to stop playing, such as ``clue.stop_tone``.
+    """
+
+    def __init__(
+        self,
+        service: ToneService,
+        start_tone: Callable[[int], None],
+        stop_tone: Callable[[], None],
+    ) -> None:
+        self._service = service
+        self._start_tone = start_tone
+        self._stop_tone = stop_tone
+        # Notes not yet started, as (frequency, duration in msecs).
+        self._queue = []
+        # When the current note ends, in msecs, or None if nothing is timed.
+        self._note_end = None
+        self._playing = False
+
+    @property
+    def playing(self) -> bool:
+        """``True`` if a tone is sounding or notes are queued."""
+        return self._playing or bool(self._queue)
+
+    def stop(self) -> None:
+        """Stop playing and discard any queued notes."""
+        self._queue = []
+        self._note_end = None
+        if self._playing:
+            self._stop_tone()
+            self._playing = False
+
+    def update(self) -> None:
+        """Check for new tones or melodies, and start or stop notes whose time has come."""
+        service = self._service
+        tone = service.tone
+        if tone is not None:
+            self.stop()
+            self._queue = [tone]
+        melody = service.melody
+        if melody is not None:
+            self.stop()
+            self._queue = melody
+
+        now_msecs = time.monotonic_ns() // 1000000
+        start_msecs = now_msecs
+        if self._note_end is not None:
+            if now_msecs < self._note_end:
+                return
+            # Start the next note when this one was due to end, so melodies don't drift.
+            start_msecs = self._note_end
+            self._note_end = None
+            if self._playing:
+                self._stop_tone()
+                self._playing = False
+        while self._queue and self._note_end is None:
+            frequency, duration_msecs = self._queue.pop(0)
+            if frequency != 0:
+                self._start_tone(frequency)
+                self._playing = True
+            if duration_msecs != 0:
+                self._note_end = start_msecs + duration_msecs
+            elif frequency != 0:
+                # Play indefinitely, until the next tone or melody.
+                self._queue = []
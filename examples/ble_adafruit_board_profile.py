@@ -0,0 +1,14 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# The same services as ble_adafruit_clue.py, built from a board profile.
+# Use circuitplayground_bluefruit_profile() or feather_bluefruit_sense_profile()
+# for those boards.
+# Accessible via Adafruit Bluefruit Playground app and Web Bluetooth Dashboard.
+
+from adafruit_ble import BLERadio
+
+from adafruit_ble_adafruit.board_profile import BoardServer, clue_profile
+
+server = BoardServer(clue_profile(period=100))
+server.run(BLERadio())
@@ -4,8 +4,6 @@
 # Adafruit Service demo for Adafruit CLUE Circuit Playground Bluefruit board.
 # Accessible via Adafruit Bluefruit Playground app and Web Bluetooth Dashboard.
 
-import time
-
 import board
 import neopixel_write
 from adafruit_ble import BLERadio
@@ -17,12 +15,12 @@ from adafruit_ble_adafruit.adafruit_service import AdafruitServerAdvertisement
 from adafruit_ble_adafruit.addressable_pixel_service import AddressablePixelService
 from adafruit_ble_adafruit.button_service import ButtonService
 from adafruit_ble_adafruit.light_sensor_service import LightSensorService
+from adafruit_ble_adafruit.sensor_scheduler import SensorScheduler
 from adafruit_ble_adafruit.temperature_service import TemperatureService
-from adafruit_ble_adafruit.tone_service import ToneService
+from adafruit_ble_adafruit.tone_service import TonePlayer, ToneService
 
 accel_svc = AccelerometerService()
 accel_svc.measurement_period = 100
-accel_last_update = 0
 
 # 3 RGB bytes * 10 pixels.
 NEOPIXEL_BUF_LENGTH = 3 * 10
@@ -38,13 +36,19 @@ button_svc.set_pressed(cp.switch, cp.button_a, cp.button_b)
 
 light_svc = LightSensorService()
 light_svc.measurement_period = 100
-light_last_update = 0
 
 temp_svc = TemperatureService()
 temp_svc.measurement_period = 100
-temp_last_update = 0
 
 tone_svc = ToneService()
+tone_player = TonePlayer(tone_svc, cp.start_tone, cp.stop_tone)
+
+# Each sensor is read only when its measurement_period says it is due.
+scheduler = SensorScheduler()
+scheduler.add(accel_svc, "reading", lambda: cp.acceleration)
+scheduler.add(button_svc, None, lambda: button_svc.set_pressed(cp.switch, cp.button_a, cp.button_b))
+scheduler.add(light_svc, "reading", lambda: cp.light)
+scheduler.add(temp_svc, "reading", lambda: cp.temperature)
 
 ble = BLERadio()
 # The Web Bluetooth dashboard identifies known boards by their
@@ -66,46 +70,13 @@ while True:
     ble.stop_advertising()
 
     while ble.connected:
-        now_msecs = time.monotonic_ns() // 1000000
-
-        if now_msecs - accel_last_update >= accel_svc.measurement_period:
-            accel_svc.acceleration = cp.acceleration
-            accel_last_update = now_msecs
-
-        button_svc.set_pressed(cp.switch, cp.button_a, cp.button_b)
-
-        if now_msecs - light_last_update >= light_svc.measurement_period:
-            light_svc.light_level = cp.light
-            light_last_update = now_msecs
-
-        neopixel_values = neopixel_svc.values
-        if neopixel_values is not None:
-            start = neopixel_values.start
-            if start > NEOPIXEL_BUF_LENGTH:
-                continue
-            data = neopixel_values.data
-            data_len = min(len(data), NEOPIXEL_BUF_LENGTH - start)
-            neopixel_buf[start : start + data_len] = data[:data_len]
-            if neopixel_values.write_now:
-                neopixel_write.neopixel_write(neopixel_out, neopixel_buf)
-
-        if now_msecs - temp_last_update >= temp_svc.measurement_period:
-            temp_svc.temperature = cp.temperature
-            temp_last_update = now_msecs
-
-        tone = tone_svc.tone
-        if tone is not None:
-            freq, duration_msecs = tone
-            if freq != 0:
-                if duration_msecs != 0:
-                    # Note that this blocks. Alternatively we could
-                    # use now_msecs to time a tone in a non-blocking
-                    # way, but then the other updates might make the
-                    # tone interval less consistent.
-                    cp.play_tone(freq, duration_msecs / 1000)
-                else:
-                    cp.stop_tone()
-                    cp.start_tone(freq)
-            else:
-                cp.stop_tone()
-        last_tone = tone
+        # Update any sensors that are due, then sleep until the next one is,
+        # waking at least every 10 msecs to check for pixel and tone writes.
+        scheduler.sleep_until_due(10)
+
+        # Copy any new pixel data straight into neopixel_buf.
+        if neopixel_svc.readinto_pixels(neopixel_buf):
+            neopixel_write.neopixel_write(neopixel_out, neopixel_buf)
+
+        # Start and stop tones without blocking sensor updates.
+        tone_player.update()
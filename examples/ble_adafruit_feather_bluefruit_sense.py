@@ -5,7 +5,7 @@
 # Accessible via Adafruit Web Bluetooth Dashboard.
 # (As of this writing, not yet accessible via Bluefruit Playground app.)
 
-import time
+import asyncio
 
 import adafruit_apds9960.apds9960
 import adafruit_bmp280
@@ -26,6 +26,7 @@ from adafruit_ble_adafruit.button_service import ButtonService
 from adafruit_ble_adafruit.humidity_service import HumidityService
 from adafruit_ble_adafruit.light_sensor_service import LightSensorService
 from adafruit_ble_adafruit.microphone_service import MicrophoneService
+from adafruit_ble_adafruit.service_runtime import ServiceRuntime
 from adafruit_ble_adafruit.temperature_service import TemperatureService
 
 # Accelerometer
@@ -49,7 +50,6 @@ mic = audiobusio.PDMIn(
 
 accel_svc = AccelerometerService()
 accel_svc.measurement_period = 100
-accel_last_update = 0
 
 # Feather Bluefruit Sense has just one board pixel. 3 RGB bytes * 1 pixel
 NEOPIXEL_BUF_LENGTH = 3 * 1
@@ -60,7 +60,6 @@ neopixel_out.switch_to_output()
 
 baro_svc = BarometricPressureService()
 baro_svc.measurement_period = 100
-baro_last_update = 0
 
 button_svc = ButtonService()
 button = digitalio.DigitalInOut(board.SWITCH)
@@ -69,23 +68,46 @@ button_svc.set_pressed(False, not button.value, False)
 
 humidity_svc = HumidityService()
 humidity_svc.measurement_period = 100
-humidity_last_update = 0
 
 light_svc = LightSensorService()
 light_svc.measurement_period = 100
-light_last_update = 0
 
 # Send 256 16-bit samples at a time.
 MIC_NUM_SAMPLES = 256
 mic_svc = MicrophoneService()
 mic_svc.number_of_channels = 1
 mic_svc.measurement_period = 100
-mic_last_update = 0
 mic_samples = np.zeros(MIC_NUM_SAMPLES, dtype=np.uint16)
+# Need to create an array of the correct type, because ulab
+# seems to get broadcasting of builtin Python types wrong.
+mic_offset = np.array([32768], dtype=np.uint16)
+
+
+def read_mic():
+    mic.record(mic_samples, len(mic_samples))
+    # This subtraction yields unsigned values, which are
+    # reinterpreted as signed 16-bit samples.
+    return np.frombuffer(mic_samples - mic_offset, dtype=np.int16)
+
 
 temp_svc = TemperatureService()
 temp_svc.measurement_period = 100
-temp_last_update = 0
+
+# Each sensor runs as its own task, so slow I2C reads don't hold up the button.
+runtime = ServiceRuntime()
+runtime.add_sensor(accel_svc, "reading", lambda: lsm6ds33.acceleration)
+runtime.add_sensor(baro_svc, "reading", lambda: bmp280.pressure)
+runtime.add_sensor(button_svc, None, lambda: button_svc.set_pressed(False, not button.value, False))
+runtime.add_sensor(humidity_svc, "reading", lambda: sht31d.relative_humidity)
+# Return "clear" color value from color sensor.
+runtime.add_sensor(light_svc, "reading", lambda: apds9960.color_data[3])
+# set_sound_samples() encodes the samples with the client's chosen sound_codec.
+runtime.add_sensor(mic_svc, None, lambda: mic_svc.set_sound_samples(read_mic()))
+runtime.add_sensor(temp_svc, "reading", lambda: bmp280.temperature)
+# Copy any new pixel data straight into neopixel_buf.
+runtime.add_pixels(
+    neopixel_svc, neopixel_buf, lambda buf: neopixel_write.neopixel_write(neopixel_out, buf)
+)
 
 ble = BLERadio()
 # The Web Bluetooth dashboard identifies known boards by their
@@ -107,46 +129,4 @@ while True:
         pass
     ble.stop_advertising()
 
-    while ble.connected:
-        now_msecs = time.monotonic_ns() // 1000000
-
-        if now_msecs - accel_last_update >= accel_svc.measurement_period:
-            accel_svc.acceleration = lsm6ds33.acceleration
-            accel_last_update = now_msecs
-
-        if now_msecs - baro_last_update >= baro_svc.measurement_period:
-            baro_svc.pressure = bmp280.pressure
-            baro_last_update = now_msecs
-
-        button_svc.set_pressed(False, not button.value, False)
-
-        if now_msecs - humidity_last_update >= humidity_svc.measurement_period:
-            humidity_svc.humidity = sht31d.relative_humidity
-            humidity_last_update = now_msecs
-
-        if now_msecs - light_last_update >= light_svc.measurement_period:
-            # Return "clear" color value from color sensor.
-            light_svc.light_level = apds9960.color_data[3]
-            light_last_update = now_msecs
-
-        if now_msecs - mic_last_update >= mic_svc.measurement_period:
-            mic.record(mic_samples, len(mic_samples))
-            # This subtraction yields unsigned values which are
-            # reinterpreted as signed after passing.
-            mic_svc.sound_samples = mic_samples - 32768
-            mic_last_update = now_msecs
-
-        neopixel_values = neopixel_svc.values
-        if neopixel_values is not None:
-            start = neopixel_values.start
-            if start > NEOPIXEL_BUF_LENGTH:
-                continue
-            data = neopixel_values.data
-            data_len = min(len(data), NEOPIXEL_BUF_LENGTH - start)
-            neopixel_buf[start : start + data_len] = data[:data_len]
-            if neopixel_values.write_now:
-                neopixel_write.neopixel_write(neopixel_out, neopixel_buf)
-
-        if now_msecs - temp_last_update >= temp_svc.measurement_period:
-            temp_svc.temperature = bmp280.temperature
-            temp_last_update = now_msecs
+    asyncio.run(runtime.run(lambda: ble.connected))
@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Collect temperature and acceleration notifications from every board
+# running ble_adafruit_simpletest.py or one of the board examples nearby.
+
+import struct
+
+import adafruit_ble
+
+from adafruit_ble_adafruit.accelerometer_service import AccelerometerService
+from adafruit_ble_adafruit.gateway import Gateway
+from adafruit_ble_adafruit.temperature_service import TemperatureService
+
+ble = adafruit_ble.BLERadio()
+
+gateway = Gateway(
+    ble,
+    ((TemperatureService, "temperature"), (AccelerometerService, "acceleration")),
+)
+
+for event in gateway.events():
+    if event.kind == Gateway.CONNECTED:
+        print(event.timestamp, event.address, "connected")
+    elif event.kind == Gateway.DISCONNECTED:
+        print(event.timestamp, event.address, "disconnected")
+    elif event.service is TemperatureService:
+        print(event.timestamp, event.address, "temperature", struct.unpack("<f", event.data)[0])
+    else:
+        print(event.timestamp, event.address, "acceleration", struct.unpack("<fff", event.data))
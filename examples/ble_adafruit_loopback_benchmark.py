@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+# Compare how long it takes to send a frame of pixels in each pixel packet format,
+# over a simulated connection. Runs on a host computer; no radios are needed.
+
+from adafruit_ble_adafruit.addressable_pixel_service import AddressablePixelService
+from adafruit_ble_adafruit.loopback import LoopbackLink
+
+PIXEL_COUNT = 100
+FRAMES = {
+    "solid": bytes((0, 32, 64)) * PIXEL_COUNT,
+    "stripes": (bytes((255, 0, 0)) * 10 + bytes((0, 0, 255)) * 10) * (PIXEL_COUNT // 20),
+    "gradient": bytes(i % 256 for i in range(3 * PIXEL_COUNT)),
+}
+
+for mtu in (23, 247):
+    for name, frame in FRAMES.items():
+        link = LoopbackLink(mtu=mtu, connection_interval=0.0075)
+        server = link.serve(AddressablePixelService, packet_queue_depth=16)
+        client = link.connection[AddressablePixelService]
+        client.write_packets(AddressablePixelService.encode_pixel_packets(frame, 3))
+        link.deliver()
+        pixels = bytearray(len(frame))
+        while server.readinto_pixels(pixels) is not None:
+            pass
+        assert pixels == frame
+        print(
+            f"MTU {mtu:3d} {name:8s}: {link.packets_sent:3d} packets,",
+            f"{link.clock * 1000:6.1f} ms",
+        )
@@ -3,17 +3,18 @@
 
 # Use with Web Bluetooth Dashboard, or with ble_adafruit_simpletest_client.py
 
-import time
-
 import microcontroller
 from adafruit_ble import BLERadio
 
 from adafruit_ble_adafruit.adafruit_service import AdafruitServerAdvertisement
+from adafruit_ble_adafruit.sensor_scheduler import SensorScheduler
 from adafruit_ble_adafruit.temperature_service import TemperatureService
 
 temp_svc = TemperatureService()
 temp_svc.measurement_period = 100
-temp_last_update = 0
+
+scheduler = SensorScheduler()
+scheduler.add(temp_svc, "reading", lambda: microcontroller.cpu.temperature)
 
 ble = BLERadio()
 
@@ -30,10 +31,5 @@ while True:
         pass
     ble.stop_advertising()
 
-    while ble.connected:
-        now_msecs = time.monotonic_ns() // 1000000
-
-        if now_msecs - temp_last_update >= temp_svc.measurement_period:
-            temp_svc.temperature = microcontroller.cpu.temperature
-
-            temp_last_update = now_msecs
+    # Update the temperature every measurement_period, sleeping in between.
+    scheduler.run(lambda: ble.connected)
@@ -1,12 +1,10 @@
 # SPDX-FileCopyrightText: 2021 ladyada for Adafruit Industries
 # SPDX-License-Identifier: MIT
 
-import time
-
 import adafruit_ble
 
 from adafruit_ble_adafruit.adafruit_service import AdafruitServerAdvertisement
-from adafruit_ble_adafruit.temperature_service import TemperatureService
+from adafruit_ble_adafruit.client_proxy import TemperatureProxy
 
 # PyLint can't find BLERadio for some reason so special case it here.
 ble = adafruit_ble.BLERadio()
@@ -24,7 +22,6 @@ while True:
     ble.stop_scan()
 
     if connection and connection.connected:
-        temp_service = connection[TemperatureService]
-        while connection.connected:
-            print("Temperature:", temp_service.temperature)
-            time.sleep(1)
+        # Receive each temperature as the server sends it, rather than reading it.
+        for _, temperature in TemperatureProxy(connection):
+            print("Temperature:", temperature)
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from adafruit_ble_adafruit.addressable_pixel_service import (
+    AddressablePixelService,
+    PixelDiffSender,
+    PixelFrameAssembler,
+)
+from adafruit_ble_adafruit.loopback import LoopbackLink
+
+RED = bytes((255, 0, 0))
+BLUE = bytes((0, 0, 255))
+
+
+def test_encode_pixel_packets_palette_bytearray():
+    pixels = bytearray((RED + BLUE) * 20)
+    palette = [bytearray(RED), bytearray(BLUE)]
+    packets = AddressablePixelService.encode_pixel_packets(pixels, 3, palette=palette)
+    assert len(packets) == 1
+    assert (packets[0][2] >> 1) & 0x7 == AddressablePixelService.PALETTE_INDEXED
+    assert packets[0][3:] == bytes((0, 1)) * 20
+
+
+def test_diff_sender_palette_bytearray():
+    link = LoopbackLink(mtu=247)
+    server = link.serve(AddressablePixelService, packet_queue_depth=8)
+    client = link.connection[AddressablePixelService]
+    sender = PixelDiffSender(client, 60)
+    palette = [RED, BLUE]
+    client.write_packets(AddressablePixelService.encode_palette_packets(palette))
+    pixels = bytearray(RED * 20)
+    assert sender.send(pixels, palette=palette) == 1
+    pixels[3:6] = BLUE
+    assert sender.send(pixels, palette=palette) == 1
+    link.deliver()
+    received = bytearray(60)
+    while server.readinto_pixels(received) is not None:
+        pass
+    assert received == pixels
+
+
+def test_assembler_range_starting_past_frame_size():
+    link = LoopbackLink(mtu=247)
+    server = link.serve(AddressablePixelService, packet_queue_depth=8)
+    server.pixel_buffer_size = 9
+    assembler = PixelFrameAssembler(server, bytearray(30), require_complete=True)
+    client = link.connection[AddressablePixelService]
+    packets = AddressablePixelService.encode_pixel_packets(bytes(9), 3, write_now=False)
+    packets += AddressablePixelService.encode_pixel_packets(bytes(range(9)), 3, start=12)
+    client.write_packets(packets)
+    link.deliver()
+    assert assembler.missing == [(0, 9)]
+    assert assembler.poll()
+
+
+def test_assembler_missing_clamped_to_frame_size():
+    link = LoopbackLink(mtu=247)
+    server = link.serve(AddressablePixelService, packet_queue_depth=8)
+    server.pixel_buffer_size = 9
+    assembler = PixelFrameAssembler(server, bytearray(30), require_complete=True)
+    client = link.connection[AddressablePixelService]
+    client.write_packets(AddressablePixelService.encode_pixel_packets(bytes(range(9)), 3, start=12))
+    link.deliver()
+    assert not assembler.poll()
+    assert assembler.missing == [(0, 9)]
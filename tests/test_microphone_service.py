@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import math
+from array import array
+
+import pytest
+
+from adafruit_ble_adafruit import audio_codec, microphone_service
+from adafruit_ble_adafruit.loopback import LoopbackLink
+from adafruit_ble_adafruit.microphone_service import MicrophoneService
+
+
+def _services():
+    link = LoopbackLink(mtu=517)
+    return link, link.serve(MicrophoneService), link.connection[MicrophoneService]
+
+
+def test_pcm16_samples_truncated_to_512_bytes():
+    link, server, client = _services()
+    server.set_sound_samples(array("h", range(300)))
+    assert len(server.sound_samples) == 512
+    assert list(client.sound_samples_values) == list(range(256))
+
+
+@pytest.mark.parametrize("count", (99, 100))
+def test_adpcm_sample_count(count):
+    samples = array("h", [(i * 300) % 4000 - 2000 for i in range(count)])
+    data = audio_codec.encode(samples, audio_codec.IMA_ADPCM)
+    assert audio_codec.sample_count(data, audio_codec.IMA_ADPCM) == count
+    assert len(audio_codec.decode(data, audio_codec.IMA_ADPCM)) == count
+
+
+def test_adpcm_odd_sample_count_over_the_air():
+    link, server, client = _services()
+    client.sound_codec = audio_codec.IMA_ADPCM
+    link.deliver()
+    server.set_sound_samples(array("h", [100] * 99))
+    assert len(client.sound_samples_values) == 99
+
+
+def test_sound_features_none_until_sent():
+    link, server, client = _services()
+    assert client.sound_features_values is None
+    server.set_sound_features(array("h", [0] * 64))
+    features = client.sound_features_values
+    assert features is not None
+    assert features.peak == 0
+
+
+def _sine(frequency, sample_rate=8000, count=256):
+    return array(
+        "h",
+        [round(10000 * math.sin(2 * math.pi * frequency * i / sample_rate)) for i in range(count)],
+    )
+
+
+@pytest.mark.parametrize("frequency", (1000, 1100))
+def test_features_without_numpy_match(monkeypatch, frequency):
+    samples = _sine(frequency)
+    with_numpy = microphone_service.compute_sound_features(samples)
+    monkeypatch.setattr(microphone_service, "np", None)
+    without_numpy = microphone_service.compute_sound_features(samples)
+    assert without_numpy.zero_crossing_rate == with_numpy.zero_crossing_rate
+    assert without_numpy.bands == pytest.approx(with_numpy.bands, rel=1e-6, abs=1e-3)
+    loudest = max(range(len(with_numpy.bands)), key=lambda band: with_numpy.bands[band])
+    assert loudest == 2
+
+
+def test_zero_crossings_through_zero():
+    # A bin-aligned sine has exact 0 samples at its sign changes.
+    features = microphone_service.compute_sound_features(_sine(1000))
+    assert features.zero_crossing_rate == pytest.approx(63 / 255)
@@ -0,0 +1,16 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from adafruit_ble_adafruit.loopback import LoopbackLink
+from adafruit_ble_adafruit.sensor_frame_service import SensorFrameService
+
+
+def test_values_none_until_frame_sent():
+    link = LoopbackLink(mtu=247)
+    server = link.serve(SensorFrameService)
+    client = link.connection[SensorFrameService]
+    assert client.values is None
+    server.set_frame(temperature=20.0)
+    assert client.values.temperature == 20.0
+    assert client.values.acceleration is None
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_ble_adafruit.button_service import ButtonService
+from adafruit_ble_adafruit.client_proxy import LightSensorProxy, TemperatureProxy
+from adafruit_ble_adafruit.compact_encoding import CompactEncoding
+from adafruit_ble_adafruit.light_sensor_service import LightSensorService
+from adafruit_ble_adafruit.loopback import LoopbackLink
+from adafruit_ble_adafruit.sensor_scheduler import SensorScheduler
+from adafruit_ble_adafruit.temperature_service import TemperatureService
+
+
+def test_services_without_encoding_have_no_reading():
+    assert not hasattr(ButtonService, "reading")
+    assert hasattr(TemperatureService, "reading")
+
+
+@pytest.mark.parametrize("encoding", (CompactEncoding.FLOAT32, CompactEncoding.INT16))
+def test_scheduler_sends_in_client_encoding(encoding):
+    link = LoopbackLink()
+    service = link.serve(TemperatureService)
+    proxy = TemperatureProxy(link.connection, encoding=encoding)
+    link.deliver()
+    scheduler = SensorScheduler()
+    scheduler.add(service, "temperature", lambda: 21.5)
+    scheduler.run_pending()
+    link.deliver()
+    assert proxy.latest == pytest.approx(21.5)
+
+
+@pytest.mark.parametrize("light_level", (0.0, 50000.0, 65535.0))
+def test_light_level_fits_int16(light_level):
+    link = LoopbackLink()
+    service = link.serve(LightSensorService)
+    proxy = LightSensorProxy(link.connection, encoding=CompactEncoding.INT16)
+    link.deliver()
+    service.reading = light_level
+    link.deliver()
+    assert proxy.latest == pytest.approx(light_level)
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import array
+
+from adafruit_ble_adafruit.loopback import LoopbackLink
+from adafruit_ble_adafruit.microphone_service import MicrophoneService
+from adafruit_ble_adafruit.sensor_scheduler import SensorScheduler
+from adafruit_ble_adafruit.temperature_service import TemperatureService
+
+
+def test_on_change_always_sends_reused_buffer():
+    link = LoopbackLink(mtu=517)
+    service = link.serve(MicrophoneService)
+    service.measurement_period = 0
+    samples = array.array("h", bytes(8))
+    reads = []
+
+    def read_mic():
+        # The same buffer each time, as a board's reader returns.
+        reads.append(1)
+        for i in range(len(samples)):
+            samples[i] = len(reads)
+        return samples
+
+    scheduler = SensorScheduler(change_poll_period=1)
+    scheduler.add(service, "sound_samples", read_mic)
+    while len(reads) < 3:
+        scheduler.sleep_until_due()
+    client = link.connection[MicrophoneService]
+    assert bytes(client.sound_samples) == bytes(array.array("h", (3, 3, 3, 3)))
+
+
+def test_on_change_skips_equal_numbers():
+    link = LoopbackLink()
+    service = link.serve(TemperatureService)
+    service.measurement_period = 0
+    readings = []
+
+    def reader():
+        readings.append(1)
+        return 20.0
+
+    scheduler = SensorScheduler(change_poll_period=1)
+    scheduler.add(service, "temperature", reader)
+    while len(readings) < 3:
+        scheduler.sleep_until_due()
+    assert service.temperature == 20.0
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import struct
+from collections import namedtuple
+
+from adafruit_ble_adafruit.adafruit_service import AdafruitServerAdvertisement
+from adafruit_ble_adafruit.server_scanner import ServerScanner, advertised_pid
+
+Address = namedtuple("Address", ("address_bytes",))
+Entry = namedtuple("Entry", ("address", "advertisement_bytes", "rssi"))
+Heard = namedtuple("Heard", ("address", "pid", "rssi"))
+
+
+def _advertisement_bytes(pid):
+    data = bytes(AdafruitServerAdvertisement.match_prefixes[0]) + struct.pack("<H", pid)
+    return bytes((len(data),)) + data
+
+
+class _Adapter:
+    def __init__(self, entries):
+        self.entries = entries
+
+    def start_scan(self, **kwargs):
+        assert kwargs["active"] is False
+        return iter(self.entries)
+
+
+class _Radio:
+    def __init__(self, entries):
+        self._adapter = _Adapter(entries)
+
+
+class _PublicRadio:
+    def __init__(self, advertisements):
+        self.advertisements = advertisements
+
+    def start_scan(self, *types, **kwargs):
+        assert types == (AdafruitServerAdvertisement,)
+        return iter(self.advertisements)
+
+
+def test_advertised_pid():
+    assert advertised_pid(_advertisement_bytes(0x8072)) == 0x8072
+    assert advertised_pid(b"\x02\x01\x06") is None
+
+
+def test_scan_adapter_dedupes():
+    board = Address(b"\x01" * 6)
+    entries = [Entry(board, _advertisement_bytes(0x8072), -40)] * 3
+    records = list(ServerScanner(_Radio(entries)).scan(timeout=0))
+    assert [(record.address, record.pid) for record in records] == [(board, 0x8072)]
+
+
+def test_scan_without_adapter_uses_public_api():
+    boards = [Address(bytes((i,)) * 6) for i in range(2)]
+    heard = [Heard(boards[0], 0x8072, -40), Heard(boards[1], None, -50), Heard(boards[0], 1, -40)]
+    records = list(ServerScanner(_PublicRadio(heard)).scan(timeout=0))
+    assert [(record.address, record.pid) for record in records] == [
+        (boards[0], 0x8072),
+        (boards[0], 1),
+    ]
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import struct
+
+from adafruit_ble_adafruit.accelerometer_service import AccelerometerService
+from adafruit_ble_adafruit.service_log import (
+    ServiceLogReader,
+    ServiceLogWriter,
+    characteristic_number,
+    replay,
+    service_number,
+)
+from adafruit_ble_adafruit.temperature_service import TemperatureService
+
+ADDRESS = bytes(range(6))
+
+
+def _write_log(path):
+    temperature = service_number(TemperatureService)
+    accelerometer = service_number(AccelerometerService)
+    compact = characteristic_number(TemperatureService, "compact")
+    assert compact == characteristic_number(AccelerometerService, "compact")
+    with open(path, "wb") as file:
+        writer = ServiceLogWriter(file)
+        writer.write(
+            100,
+            ADDRESS,
+            temperature,
+            characteristic_number(TemperatureService, "temperature"),
+            struct.pack("<f", 21.5),
+        )
+        writer.write(
+            110,
+            ADDRESS,
+            accelerometer,
+            characteristic_number(AccelerometerService, "acceleration"),
+            struct.pack("<fff", 1.0, 2.0, 3.0),
+        )
+        writer.write(120, ADDRESS, temperature, compact, b"\x01\x02")
+        writer.write(130, ADDRESS, accelerometer, compact, b"\x03\x04\x05\x06\x07\x08")
+
+
+def test_replay_keys_on_service_and_characteristic(tmp_path):
+    path = str(tmp_path / "session.log")
+    _write_log(path)
+    with ServiceLogReader(path) as reader:
+        values = [
+            (record.timestamp, record.service, value)
+            for record, value in replay(reader, speed=None)
+        ]
+    temperature = service_number(TemperatureService)
+    accelerometer = service_number(AccelerometerService)
+    assert values == [
+        (100, temperature, 21.5),
+        (110, accelerometer, (1.0, 2.0, 3.0)),
+        (120, temperature, b"\x01\x02"),
+        (130, accelerometer, b"\x03\x04\x05\x06\x07\x08"),
+    ]
+
+
+def test_truncated_log(tmp_path):
+    path = str(tmp_path / "session.log")
+    _write_log(path)
+    with open(path, "rb") as file:
+        log = file.read()
+    with ServiceLogReader(path) as reader:
+        timestamps = [record.timestamp for record in reader]
+    for size in range(6, len(log)):
+        truncated = str(tmp_path / "truncated.log")
+        with open(truncated, "wb") as file:
+            file.write(log[:size])
+        with ServiceLogReader(truncated) as reader:
+            found = [record.timestamp for record in reader]
+        assert found == timestamps[: len(found)]
+    assert len(found) == len(timestamps) - 1
@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import array
+import asyncio
+
+import pytest
+
+from adafruit_ble_adafruit.loopback import LoopbackLink
+from adafruit_ble_adafruit.microphone_service import MicrophoneService
+from adafruit_ble_adafruit.service_runtime import ServiceRuntime
+from adafruit_ble_adafruit.temperature_service import TemperatureService
+
+
+def test_reader_error_is_raised_from_run():
+    link = LoopbackLink()
+    service = link.serve(TemperatureService)
+    service.measurement_period = 10
+
+    def broken_reader():
+        raise OSError("sensor disconnected")
+
+    runtime = ServiceRuntime()
+    runtime.add_sensor(service, "temperature", broken_reader)
+    with pytest.raises(OSError, match="sensor disconnected"):
+        asyncio.run(asyncio.wait_for(runtime.run(lambda: True), 1))
+
+
+def test_run_stops_when_keep_running_is_false():
+    link = LoopbackLink()
+    service = link.serve(TemperatureService)
+    service.measurement_period = 10
+    readings = []
+
+    def reader():
+        readings.append(1)
+        return 20.0
+
+    runtime = ServiceRuntime()
+    runtime.add_sensor(service, "temperature", reader)
+    asyncio.run(runtime.run(lambda: len(readings) < 3))
+    assert service.temperature == 20.0
+
+
+def test_on_change_always_sends_reused_buffer():
+    link = LoopbackLink(mtu=517)
+    service = link.serve(MicrophoneService)
+    service.measurement_period = 0
+    samples = array.array("h", bytes(8))
+    reads = []
+
+    def read_mic():
+        # The same buffer each time, as a board's reader returns.
+        reads.append(1)
+        for i in range(len(samples)):
+            samples[i] = len(reads)
+        return samples
+
+    runtime = ServiceRuntime(change_poll_period=1)
+    runtime.add_sensor(service, "sound_samples", read_mic)
+    asyncio.run(runtime.run(lambda: len(reads) < 3))
+    client = link.connection[MicrophoneService]
+    assert bytes(client.sound_samples) == bytes(array.array("h", [len(reads)] * 4))
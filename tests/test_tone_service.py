@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import struct
+
+from adafruit_ble_adafruit.loopback import LoopbackLink
+from adafruit_ble_adafruit.tone_service import ToneService, _TonePacket
+
+
+def _play(link, client, count):
+    for frequency in range(440, 440 + count):
+        client._tone_packet.write(struct.pack(_TonePacket.format, frequency, 100))
+    link.deliver()
+
+
+def _drain(server):
+    tones = []
+    while True:
+        tone = server.tone
+        if tone is None:
+            return tones
+        tones.append(tone)
+
+
+def test_max_packets_per_drain():
+    link = LoopbackLink()
+    server = link.serve(ToneService, packet_queue_depth=4)
+    client = link.connection[ToneService]
+    for _ in range(3):
+        _play(link, client, 1)
+        assert len(_drain(server)) == 1
+    assert server.packets_received == 3
+    assert server.max_packets_per_drain == 1
+    _play(link, client, 3)
+    assert len(_drain(server)) == 3
+    # Below the queue depth: nothing was dropped.
+    assert server.max_packets_per_drain == 3
+    _play(link, client, 6)
+    assert len(_drain(server)) == 4
+    assert server.max_packets_per_drain == server.packet_queue_depth
+
+
+def test_full_drains():
+    link = LoopbackLink()
+    server = link.serve(ToneService, packet_queue_depth=4)
+    client = link.connection[ToneService]
+    _play(link, client, 3)
+    _drain(server)
+    # Below the queue depth: nothing was dropped.
+    assert server.full_drains == {}
+    for _ in range(2):
+        _play(link, client, 6)
+        _drain(server)
+    # Counted once per drain, however far past the depth the writes went.
+    assert server.full_drains == {"_tone_packet": 2}
+    for _ in range(5):
+        client.play_melody([(440, 0.1)])
+    link.deliver()
+    while server.melody is not None:
+        pass
+    # Each packet queue is counted separately.
+    assert server.full_drains == {"_tone_packet": 2, "_melody_packet": 1}